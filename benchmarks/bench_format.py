@@ -0,0 +1,42 @@
+# Licensed under the LGPL 3.0 License.
+# i18nco by numlinka.
+# benchmark
+
+# site
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+# self
+import i18nco
+
+
+TEMPLATE = "{user} sent {0} files to {target} in {folder} at {1}, {count} left ({2})"
+
+
+def test_sformat(benchmark) -> None:
+    text = i18nco.I18nString(TEMPLATE)
+    benchmark(text.sformat, "a", "b", "c", user="alice", target="bob", folder="docs", count=3)
+
+
+def test_sformat_partial(benchmark) -> None:
+    # Two values for seven placeholders, the rest is filled in later.
+    text = i18nco.I18nString(TEMPLATE)
+    benchmark(text.sformat, "a", "b")
+
+
+def test_sformat_uncached(benchmark) -> None:
+    # A new string every call, as for texts that are not in the translation cache.
+    def run() -> str:
+        return i18nco.I18nString(TEMPLATE).sformat("a", "b", "c", user="alice", target="bob", folder="docs", count=3)
+
+    benchmark(run)
+
+
+def test_sformat_translated(benchmark, i18n, sample_keys) -> None:
+    key = sample_keys[0]
+
+    def run() -> str:
+        return i18n.con_translation(key).sformat(1, name="alice")
+
+    benchmark(run)
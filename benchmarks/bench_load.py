@@ -0,0 +1,65 @@
+# Licensed under the LGPL 3.0 License.
+# i18nco by numlinka.
+# benchmark
+
+# std
+import os
+from typing import *
+
+# site
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+# self
+import i18nco
+from conftest import LOCALES, build_i18n, peak_memory, write_csv, write_json, write_lang
+
+
+WRITERS = {
+    "json": write_json,
+    "lang": write_lang,
+    "csv": write_csv,
+}
+
+
+@pytest.fixture(scope="session", params=list(WRITERS))
+def catalog_path(request, catalog: Dict[str, Dict[str, str]], tmp_path_factory) -> str:
+    path = str(tmp_path_factory.mktemp(request.param))
+    WRITERS[request.param](path, catalog)
+    return path
+
+
+def run_load(benchmark, load: Callable[[], Any]) -> None:
+    benchmark.extra_info["peak_memory_bytes"] = peak_memory(load)
+    benchmark.pedantic(load, rounds=3, iterations=1)
+
+
+def test_auto_load(benchmark, catalog_path: str) -> None:
+    run_load(benchmark, lambda: i18nco.Internationalization().con_auto_load(catalog_path))
+
+
+def test_auto_load_workers(benchmark, catalog_path: str) -> None:
+    run_load(benchmark, lambda: i18nco.Internationalization().con_auto_load(catalog_path, workers=4, use_process=True))
+
+
+def test_auto_load_lazy(benchmark, catalog_path: str) -> None:
+    run_load(benchmark, lambda: i18nco.Internationalization().con_auto_load(catalog_path, lazy=True))
+
+
+def test_load_catalog(benchmark, catalog: Dict[str, Dict[str, str]], tmp_path) -> None:
+    file_path = os.path.join(str(tmp_path), "catalog.i18nc")
+    build_i18n(catalog).con_compile_catalog(file_path)
+    # A key that exists for flat and nested catalogs, so the first lookup is a hit.
+    key = next(iter(catalog[LOCALES[0]]))
+
+    def load() -> None:
+        i18n = i18nco.Internationalization()
+        i18n.con_load_catalog(file_path)
+        i18n.con_translation(key)
+
+    run_load(benchmark, load)
+
+
+def test_add_translations(benchmark, catalog: Dict[str, Dict[str, str]]) -> None:
+    run_load(benchmark, lambda: build_i18n(catalog))
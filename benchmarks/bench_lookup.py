@@ -0,0 +1,98 @@
+# Licensed under the LGPL 3.0 License.
+# i18nco by numlinka.
+# benchmark
+
+# std
+import threading
+import functools
+from typing import *
+
+# site
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+
+def test_attribute_access(benchmark, i18n, sample_keys) -> None:
+    # Dotted keys are walked one attribute at a time, the way `i18n.ns1.group1.item1` is.
+    paths = [key.split(".") for key in sample_keys]
+
+    def run() -> None:
+        for path in paths:
+            functools.reduce(getattr, path, i18n)
+
+    benchmark(run)
+
+
+def test_translation(benchmark, i18n, sample_keys) -> None:
+    translation = i18n.con_translation
+
+    def run() -> None:
+        for key in sample_keys:
+            translation(key)
+
+    benchmark(run)
+
+
+def test_accessor(benchmark, i18n, sample_keys) -> None:
+    accessors = [i18n.con_accessor(key) for key in sample_keys]
+
+    def run() -> None:
+        for accessor in accessors:
+            accessor()
+
+    benchmark(run)
+
+
+def test_translate_many(benchmark, i18n, sample_keys) -> None:
+    benchmark(i18n.con_translate_many, sample_keys)
+
+
+def test_missing_keys(benchmark, i18n) -> None:
+    keys = [f"missing.key{index}" for index in range(1000)]
+    translation = i18n.con_translation
+
+    def run() -> None:
+        for key in keys:
+            translation(key)
+
+    benchmark(run)
+
+
+def test_set_locale(benchmark, i18n) -> None:
+    # Every switch publishes a snapshot and rebuilds the merged table.
+    def run() -> None:
+        i18n.con_set_locale("zh_CN")
+        i18n.con_set_locale("en_US")
+
+    benchmark(run)
+
+
+def test_use_locale(benchmark, i18n, sample_keys) -> None:
+    translation = i18n.con_translation
+
+    def run() -> None:
+        with i18n.con_use_locale("zh_CN"):
+            for key in sample_keys:
+                translation(key)
+
+    benchmark(run)
+
+
+@pytest.mark.parametrize("threads", [8, 32])
+def test_threaded_lookup(benchmark, i18n, sample_keys, threads: int) -> None:
+    translation = i18n.con_translation
+
+    def worker() -> None:
+        for key in sample_keys:
+            translation(key)
+
+    def run() -> None:
+        pool = [threading.Thread(target=worker) for _ in range(threads)]
+        for thread in pool:
+            thread.start()
+
+        for thread in pool:
+            thread.join()
+
+    benchmark.pedantic(run, rounds=5, iterations=1)
@@ -0,0 +1,127 @@
+# Licensed under the LGPL 3.0 License.
+# i18nco by numlinka.
+# benchmark
+
+# std
+import os
+import csv
+import sys
+import json
+import tracemalloc
+from typing import *
+
+# site
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+# self
+import i18nco
+
+
+LOCALES = ("en_US", "zh_CN")
+
+# 1000000 keys is left out by default, set I18NCO_BENCH_SIZES=10000,100000,1000000 to include it.
+SIZES = [int(x) for x in os.environ.get("I18NCO_BENCH_SIZES", "10000,100000").split(",") if x]
+
+
+def generate_keys(size: int, nested: bool) -> List[str]:
+    """
+    ## synthetic keys
+
+    Flat keys look like `key123`, nested keys like `ns1.group12.section3.item123`.
+    """
+    if not nested:
+        return [f"key{index}" for index in range(size)]
+
+    return [f"ns{index % 10}.group{index % 100}.section{index % 7}.item{index}" for index in range(size)]
+
+
+def generate_catalog(size: int, nested: bool = False) -> Dict[str, Dict[str, str]]:
+    keys = generate_keys(size, nested)
+    return {
+        locale: {key: f"{locale} text {index} for {{name}} and {{0}}" for index, key in enumerate(keys)}
+        for locale in LOCALES
+    }
+
+
+def nest(table: Dict[str, str]) -> Dict[str, Any]:
+    result: Dict[str, Any] = {}
+    for key, text in table.items():
+        *parents, name = key.split(".")
+        node = result
+        for parent in parents:
+            node = node.setdefault(parent, {})
+
+        node[name] = text
+
+    return result
+
+
+def write_json(path: str, catalog: Dict[str, Dict[str, str]]) -> None:
+    for locale, table in catalog.items():
+        with open(os.path.join(path, f"{locale}.json"), "w", encoding="utf-8") as file_object:
+            json.dump(nest(table), file_object, ensure_ascii=False)
+
+
+def write_lang(path: str, catalog: Dict[str, Dict[str, str]]) -> None:
+    for locale, table in catalog.items():
+        with open(os.path.join(path, f"{locale}.lang"), "w", encoding="utf-8") as file_object:
+            file_object.writelines(f"{key} = {text}\n" for key, text in table.items())
+
+
+def write_csv(path: str, catalog: Dict[str, Dict[str, str]]) -> None:
+    with open(os.path.join(path, "catalog.csv"), "w", encoding="utf-8", newline="") as file_object:
+        writer = csv.writer(file_object)
+        writer.writerow(["locale", "key", "value"])
+        for locale, table in catalog.items():
+            writer.writerows([locale, key, text] for key, text in table.items())
+
+
+def build_i18n(catalog: Dict[str, Dict[str, str]]) -> i18nco.Internationalization:
+    i18n = i18nco.Internationalization()
+    for locale, table in catalog.items():
+        i18n.con_add_translations(locale, table)
+
+    i18n.con_set_locale(*LOCALES)
+    return i18n
+
+
+def peak_memory(function: Callable[[], Any]) -> int:
+    """
+    ## peak memory of one call, in bytes
+    """
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1]
+
+    finally:
+        tracemalloc.stop()
+
+
+@pytest.fixture(scope="session", params=SIZES, ids=lambda size: f"{size}keys")
+def size(request) -> int:
+    return request.param
+
+
+@pytest.fixture(scope="session", params=[False, True], ids=["flat", "nested"])
+def nested(request) -> bool:
+    return request.param
+
+
+@pytest.fixture(scope="session")
+def catalog(size: int, nested: bool) -> Dict[str, Dict[str, str]]:
+    return generate_catalog(size, nested)
+
+
+@pytest.fixture(scope="session")
+def i18n(catalog: Dict[str, Dict[str, str]]) -> i18nco.Internationalization:
+    return build_i18n(catalog)
+
+
+@pytest.fixture(scope="session")
+def sample_keys(catalog: Dict[str, Dict[str, str]]) -> List[str]:
+    keys = list(catalog[LOCALES[0]])
+    step = max(1, len(keys) // 1000)
+    return keys[::step][:1000]
@@ -8,14 +8,37 @@ __copyright__ = "Copyright (C) 2022 numlinka"
 
 # self
 from .i18nstring import *
+from .i18naccessor import *
+from .i18nreport import *
 from .internationalization import *
 
 
+# Submodules that are only imported on first attribute access, e.g. `i18nco.constants`.
+_lazy_submodules = (
+    "constants",
+    "components",
+    "utils",
+    "i18ncatalog",
+    "i18nmetrics",
+)
+
+
+def __getattr__(name: str):
+    if name in _lazy_submodules:
+        import importlib
+        return importlib.import_module(f".{name}", __package__)
+
+    raise AttributeError(f"module {__package__!r} has no attribute {name!r}")
+
+
 __version_info__ = (1, 2, 2)
 __version__ = ".".join(map(str, __version_info__))
 
 
 __all__ = [
     "I18nString",
+    "I18nAccessor",
+    "FileLoadReport",
+    "LoadReport",
     "Internationalization"
 ]
@@ -3,14 +3,21 @@
 
 # std
 import os
-import csv
-import json
+import time
+import threading
+import itertools
 from typing import *
+from collections.abc import Mapping
 
 # self
 from .utils import *
 from .schemas import *
 from .i18nbase import BaseI18n
+from .i18nreport import FileLoadReport, LoadReport
+
+
+# Number of entries per locale collected before they are merged into the store.
+LOAD_BATCH_SIZE = 4096
 
 
 class I18nComponent (object):
@@ -18,149 +25,307 @@ class I18nComponent (object):
         if isinstance(self, BaseI18n):
             raise TypeError("I18nComponent is not a base class")
 
+    def _con_add_entries(self, entries: Iterable[Tuple[Union[LocaleCode, LocaleCodeList], TextKey, str]],
+                         report: Optional[FileLoadReport] = None) -> None:
+        """
+        ## Add a stream of entries in batches
 
-class I18nCSVLoad (I18nComponent):
-    def con_load_csv_i18n(self, file_path: str, *, encoding: str = "utf-8") -> None:
+        Entries are grouped per locale and merged with `con_add_translations`
+        every `LOAD_BATCH_SIZE` entries, all inside one transaction.
+        The counts are added to `report` if one is given.
+        """
         self: BaseI18n
-        with open(file_path, "r", encoding=encoding) as file_object:
-            reader = csv.DictReader(file_object)
+        batches: Dict[LocaleCode, Dict[TextKey, str]] = {}
+
+        def flush(locale_: LocaleCode, batch: Dict[TextKey, str]) -> None:
+            if report is not None:
+                table = self._sc_staging.get(locale_, None)
+                report.entries += len(batch)
+                report.overwritten += len(batch.keys() & table.keys()) if table else 0
+                report.locales.add(locale_)
+
+            self.con_add_translations(locale_, batch)
+
+        with self._con_transaction():
+            for locale, key, text in entries:
+                for locale_ in (locale if isinstance(locale, list) else (locale,)):
+                    batch = batches.get(locale_, None)
+                    if batch is None:
+                        batch = batches[locale_] = {}
+
+                    batch[key] = text
+
+                    if len(batch) >= LOAD_BATCH_SIZE:
+                        flush(locale_, batch)
+                        batches[locale_] = {}
+
+            for locale_, batch in batches.items():
+                flush(locale_, batch)
+
+    def _con_load_file(self, format: str, file_path: str,
+                       entries: Iterable[Tuple[Union[LocaleCode, LocaleCodeList], TextKey, str]],
+                       elapsed: float = 0.0) -> FileLoadReport:
+        # Adds the entries of one file and measures it, `elapsed` is time already spent parsing elsewhere.
+        self: Union[BaseI18n, I18nComponent]
+        started = time.perf_counter()
+        report = FileLoadReport(file_path, format, os.path.getsize(file_path))
+        self._con_add_entries(entries, report)
+        report.elapsed = elapsed + time.perf_counter() - started
+        return report
+
+    def _con_load_single(self, format: str, file_path: str,
+                         entries: Iterable[Tuple[Union[LocaleCode, LocaleCodeList], TextKey, str]]) -> LoadReport:
+        self: Union[BaseI18n, I18nComponent]
+        report = LoadReport()
+        report.files.append(self._con_load_file(format, file_path, entries))
+        report.elapsed = report.files[0].elapsed
+        return report
+
+
+def read_csv_entries(file_path: str, encoding: str = "utf-8", locale_column: str = "locale",
+                     key_column: str = "key", value_column: str = "value"
+                     ) -> Iterator[Tuple[LocaleCode, TextKey, str]]:
+    import csv
+
+    with open(file_path, "r", encoding=encoding, newline="") as file_object:
+        reader = csv.reader(file_object)
+        header = next(reader, None)
+
+        if header is None:
+            return
+
+        try:
+            locale_index = header.index(locale_column)
+            key_index = header.index(key_column)
+            value_index = header.index(value_column)
+
+        except ValueError as _:
+            raise ValueError(f"{file_path} must have the columns {locale_column!r}, "
+                             f"{key_column!r} and {value_column!r}.") from None
+
+        width = max(locale_index, key_index, value_index) + 1
+
+        while True:
+            rows = []
+            read = 0
+
+            for row in itertools.islice(reader, LOAD_BATCH_SIZE):
+                read += 1
+                if not row:
+                    continue
 
-        for row in reader:
-            row: dict
-            locale = row["locale"]
-            key = row["key"]
-            value = row["value"]
-            value = decode_escape_sequences(value)
+                if len(row) < width:
+                    raise ValueError(f"{file_path}, line {reader.line_num}: "
+                                     f"expected {width} columns, got {len(row)}.")
 
-            self.con_add_translation(locale, key, value)
+                rows.append(row)
 
+            if not read:
+                break
 
-class I18nJsonLoad (I18nComponent):
-    def con_load_dict(self, dictionary: Dict[TextKey, str], locale: LocaleCode = ..., superiors: str = ...) -> None:
-        self: BaseI18n
-        if superiors is Ellipsis:
-            superiors = ""
+            texts = decode_escape_sequences_many([row[value_index] for row in rows])
+            for row, text in zip(rows, texts):
+                yield row[locale_index], row[key_index], text
 
-        for key, value in dictionary.items():
-            final_key = f"{superiors}.{key}" if superiors != "" else key
 
-            if isinstance(value, str):
-                self.con_add_translation(locale, final_key, value)
+def read_json_entries(file_path: str, locale: LocaleCode, encoding: str = "utf-8"
+                      ) -> Iterator[Tuple[LocaleCode, TextKey, str]]:
+    import json
 
-            elif isinstance(value, dict):
-                self.con_load_dict(value, locale, final_key)
+    with open(file_path, "r", encoding=encoding) as file_object:
+        content = file_object.read()
 
-    def con_load_json(self, file_path: str, locale: LocaleCode = ..., *, encoding: str = "utf-8") -> None:
-        self: BaseI18n
-        if locale is ...:
-            locale = self.con_get_locale()
+    data = json.loads(content)
+    for key, text in flatten_dict(data).items():
+        yield locale, key, text
 
-        with open(file_path, "r", encoding=encoding) as file_object:
-            content = file_object.read()
 
-        data = json.loads(content)
-        self.con_load_dict(data, locale)
+def read_lang_entries(file_path: str, locale: LocaleCode, superiors: str = "", encoding: str = "utf-8"
+                      ) -> Iterator[Tuple[Union[LocaleCode, LocaleCodeList], TextKey, str]]:
+    with open(file_path, "r", encoding=encoding) as file_object:
+        yield from iter_lang_entries(file_object, locale, superiors)
 
-    def con_load_json_i18n(self, file_path: str, *, encoding: str = "utf-8") -> None:
-        self: BaseI18n
-        with open(file_path, "r", encoding=encoding) as file_object:
-            content = file_object.read()
 
-        data = json.loads(content)
-        for locale, dictionary in data.items():
-            self.con_load_dict(dictionary, locale)
+def lang_defines_locale(file_path: str) -> bool:
+    # Whether a .lang file switches to other locales with `#define locale`.
+    with open(file_path, "rb") as file_object:
+        return b"#define locale" in file_object.read()
 
 
-class I18nLangLoad (I18nComponent):
-    def con_load_lang(self, file_path: str, locale: LocaleCode = ..., superiors: str = ...,
-                      *, encoding: str = "utf-8") -> None:
-        self: BaseI18n
-        if locale is ...:
-            locale = self.con_get_locale()
-
-        if superiors is ...:
-            superiors = ""
+def read_json_i18n_entries(file_path: str, encoding: str = "utf-8") -> Iterator[Tuple[LocaleCode, TextKey, str]]:
+    import json
 
-        with open(file_path, "r", encoding=encoding) as file_object:
-            contents = file_object.readlines()
+    with open(file_path, "r", encoding=encoding) as file_object:
+        content = file_object.read()
 
-        multiline_mode = False
-        multiline_line = []
-        key = ""
+    data = json.loads(content)
+    for locale, dictionary in data.items():
+        for key, text in flatten_dict(dictionary).items():
+            yield locale, key, text
 
-        for line in contents:
-            line = line.strip()
-            print(superiors)
 
-            if not multiline_mode:
-                if line.startswith("#define"):
-                    define, value = InstructionBreakdown.define(line)
+# Format names of the file readers, as used in load reports.
+READER_FORMATS = {
+    read_csv_entries: "csv",
+    read_json_entries: "json",
+    read_json_i18n_entries: "json",
+    read_lang_entries: "lang",
+}
 
-                    if define == "locale":
-                        if not value:
-                            continue
 
-                        locale = value
+def collect_entries(reader: Callable[..., Iterable[tuple]], args: tuple) -> Tuple[List[tuple], float]:
+    # Runs in the worker pool of `con_auto_load`, must stay a picklable module level function.
+    started = time.perf_counter()
+    entries = list(reader(*args))
+    return entries, time.perf_counter() - started
 
-                    elif define == "superiors":
-                        if not value or value[0] in [".", "/", "#"]:
-                            superiors = ""
 
-                        elif isinstance(value, str):
-                            superiors = value
+class I18nLazyTable (Mapping):
+    """
+    ## Translation table that is parsed on first use
 
-                        elif isinstance(value, list):
-                            superiors = ".".join(value)
+    Holds the files of one locale and parses them the first time the table is read.
+    A file that fails to parse is logged and left out, the failure is kept in `errors`
+    and the file is not parsed again.
+    """
 
-                    continue
+    def __init__(self, locale: LocaleCode, plan: List[Tuple[Callable[..., Iterable[tuple]], tuple]]) -> None:
+        self._locale = locale
+        self._plan = plan
+        self._table: Optional[Dict[TextKey, str]] = None
+        self._lock = threading.Lock()
+        self.errors: List[Tuple[str, Exception]] = []
 
-                elif line.startswith("#"):
-                    continue
+    @property
+    def loaded(self) -> bool:
+        return self._table is not None
 
-                elif line.startswith(";"):
-                    continue
+    def _get_table(self) -> Dict[TextKey, str]:
+        table = self._table
+        if table is not None:
+            return table
 
-                elif line.startswith("//"):
-                    continue
+        with self._lock:
+            if self._table is None:
+                table = {}
+                for reader, args in self._plan:
+                    try:
+                        entries = {
+                            intern_key(key): text for locale, key, text in reader(*args)
+                            if locale == self._locale or (isinstance(locale, list) and self._locale in locale)
+                        }
 
-                else:
-                    lst = line.split("=", 1)
-                    if len(lst) != 2:
+                    except (OSError, ValueError) as error:
+                        # Raised from a lookup otherwise, and again on every lookup.
+                        import logging
+                        logging.getLogger(__name__).error("i18nco failed to load %s: %s", args[0], error)
+                        self.errors.append((args[0], error))
                         continue
 
-                    key = lst[0].strip()
-                    line = lst[1].strip()
+                    table.update(entries)
 
-            if line.endswith(" \\"):
-                multiline_mode = True
-                line = line[:-2]
+                self._table = table
 
-            else:
-                multiline_mode = False
+            return self._table
 
-            if len(line) >= 2 and line.startswith('"') and line.endswith('"'):
-                line = line[1:-1]
+    def __getitem__(self, key: TextKey) -> str:
+        return self._get_table()[key]
 
-            if multiline_mode:
-                multiline_line.append(line)
-                continue
+    def __contains__(self, key: object) -> bool:
+        return key in self._get_table()
 
-            final_key = f"{superiors}.{key}" if superiors != "" else key
+    def __iter__(self) -> Iterator[TextKey]:
+        return iter(self._get_table())
 
-            if multiline_line:
-                multiline_line.append(line)
-                line = "\n".join(multiline_line)
-                multiline_line = []
+    def __len__(self) -> int:
+        return len(self._get_table())
 
-            line = decode_escape_sequences(line)
-            self.con_add_translation(locale, final_key, line)
 
-        else:
-            if multiline_line:
-                final_key = f"{superiors}.{key}" if superiors != "" else key
-                line = "\n".join(multiline_line)
-                line = decode_escape_sequences(line)
-                self.con_add_translation(locale, final_key, line)
+class I18nCSVLoad (I18nComponent):
+    def con_load_csv_i18n(self, file_path: str, *, encoding: str = "utf-8", locale_column: str = "locale",
+                          key_column: str = "key", value_column: str = "value") -> LoadReport:
+        """
+        ## Load a multi-language .csv file
+
+        Rows are read while the file is open and merged per locale in batches.
+        The column names can be changed to match files with other headers.
+        """
+        self: Union[BaseI18n, I18nComponent]
+        return self._con_load_single(
+            "csv", file_path, read_csv_entries(file_path, encoding, locale_column, key_column, value_column))
+
+
+class I18nJsonLoad (I18nComponent):
+    def con_load_dict(self, dictionary: Dict[TextKey, str], locale: LocaleCode = ..., superiors: str = ...) -> None:
+        self: BaseI18n
+        if superiors is Ellipsis:
+            superiors = ""
+
+        self.con_add_translations(locale, flatten_dict(dictionary, superiors))
+
+    def con_load_json(self, file_path: str, locale: LocaleCode = ..., *, encoding: str = "utf-8") -> LoadReport:
+        self: Union[BaseI18n, I18nComponent]
+        if locale is ...:
+            locale = self.con_get_locale()
+
+        return self._con_load_single("json", file_path, read_json_entries(file_path, locale, encoding))
+
+    def con_load_json_i18n(self, file_path: str, *, encoding: str = "utf-8") -> LoadReport:
+        self: Union[BaseI18n, I18nComponent]
+        return self._con_load_single("json", file_path, read_json_i18n_entries(file_path, encoding))
+
+
+class I18nLangLoad (I18nComponent):
+    def con_load_lang(self, file_path: str, locale: LocaleCode = ..., superiors: str = ...,
+                      *, encoding: str = "utf-8") -> LoadReport:
+        self: Union[BaseI18n, I18nComponent]
+        if locale is ...:
+            locale = self.con_get_locale()
+
+        if superiors is ...:
+            superiors = ""
+
+        return self._con_load_single("lang", file_path, read_lang_entries(file_path, locale, superiors, encoding))
+
+
+class I18nCatalogLoad (I18nComponent):
+    def con_compile_catalog(self, file_path: str) -> None:
+        """
+        ## Compile the loaded translations into a binary catalog
+        """
+        self: BaseI18n
+        from .i18ncatalog import write_catalog
+
+        write_catalog(file_path, self._sc_snapshot.folded())
+
+    def con_load_catalog(self, file_path: str) -> LoadReport:
+        """
+        ## Load a binary catalog
+
+        The catalog is memory-mapped, locales that are not loaded yet use it directly
+        and their texts are only decoded when they are read.
+        """
+        self: Union[BaseI18n, I18nComponent]
+        from .i18ncatalog import I18nCatalog
+
+        started = time.perf_counter()
+        catalog = I18nCatalog(file_path)
+        file_report = FileLoadReport(file_path, "catalog", os.path.getsize(file_path))
+
+        with self._con_transaction() as staging:
+            for locale, table in catalog.tables.items():
+                if staging.get(locale, None):
+                    self._con_add_entries(((locale, key, text) for key, text in table.items()), file_report)
+
+                else:
+                    self._con_staging_assign(locale, table)
+                    file_report.entries += len(table)
+                    file_report.locales.add(locale)
+
+        report = LoadReport()
+        report.files.append(file_report)
+        report.elapsed = file_report.elapsed = time.perf_counter() - started
+        return report
 
 
 class I18nAutoLoad (object):
@@ -168,13 +333,16 @@ class I18nAutoLoad (object):
         if isinstance(self, BaseI18n):
             raise TypeError("I18nAutoLoad is not a base class")
 
-    def con_auto_load(self, path: str, *, locale: LocaleCode = ...):
-        self: Union[I18nCSVLoad, I18nJsonLoad, I18nLangLoad, I18nAutoLoad]
+    @staticmethod
+    def _con_auto_load_plan(path: str, locale: LocaleCode = ...) -> List[Tuple[Callable[..., Iterable[tuple]], tuple]]:
+        # The files `con_auto_load` would read, in load order, as (reader, arguments) pairs.
+        plan = []
+
         for filename in os.listdir(path):
             filepath = os.path.join(path, filename)
 
             if os.path.isdir(filepath) and locale is Ellipsis:
-                self.con_auto_load(filepath, locale=filename)
+                plan.extend(I18nAutoLoad._con_auto_load_plan(filepath, filename))
 
             if not os.path.isfile(filepath):
                 continue
@@ -186,28 +354,325 @@ class I18nAutoLoad (object):
 
             if locale is Ellipsis:
                 if suffix == "json":
-                    self.con_load_json(filepath, locale=name)
+                    plan.append((read_json_entries, (filepath, name)))
                 elif suffix == "csv":
-                    self.con_load_csv_i18n(filepath)
+                    plan.append((read_csv_entries, (filepath,)))
                 elif suffix == "lang":
-                    self.con_load_lang(filepath, locale=name)
+                    plan.append((read_lang_entries, (filepath, name)))
                 else:
                     continue
 
             else:
                 if suffix == "json":
-                    self.con_load_json(filepath, locale=locale)
+                    plan.append((read_json_entries, (filepath, locale)))
                 elif suffix == "csv":
-                    self.con_load_csv_i18n(filepath)
+                    plan.append((read_csv_entries, (filepath,)))
                 elif suffix == "lang":
-                    self.con_load_lang(filepath, locale=locale, superiors=name)
+                    plan.append((read_lang_entries, (filepath, locale, name)))
                 else:
                     continue
 
+        return plan
+
+    def con_auto_load(self, path: str, *, locale: LocaleCode = ..., workers: int = 1, use_process: bool = False,
+                      lazy: bool = False) -> LoadReport:
+        """
+        ## Load every language file in a directory
+
+        With `workers` greater than 1 the files are parsed in a thread pool,
+        or a process pool if `use_process` is True, and all results are published at once.
+        Threads only help when parsing releases the GIL, for pure Python parsing use processes.
+
+        With `lazy` the .json and .lang files of a locale outside the fallback chain are only parsed
+        when that locale is first used, they are listed in `deferred` of the report.
+        .csv files and .lang files that use `#define locale` are always loaded immediately.
+
+        Returns a report with the time, size and entries of every file.
+        """
+        self: Union[BaseI18n, I18nComponent, I18nAutoLoad]
+        started = time.perf_counter()
+        report = LoadReport()
+        plan = self._con_auto_load_plan(path, locale)
+        pending: Dict[LocaleCode, List[Tuple[Callable[..., Iterable[tuple]], tuple]]] = {}
+
+        if lazy:
+            eager = []
+            for reader, args in plan:
+                if reader is read_csv_entries or (reader is read_lang_entries and lang_defines_locale(args[0])):
+                    eager.append((reader, args))
+                else:
+                    pending.setdefault(args[1], []).append((reader, args))
+
+            plan = eager
+
+        if workers <= 1 or len(plan) <= 1:
+            results = [(reader(*args), 0.0) for reader, args in plan]
+
+        else:
+            from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+            executor_class = ProcessPoolExecutor if use_process else ThreadPoolExecutor
+            with executor_class(max_workers=workers) as executor:
+                results = list(executor.map(collect_entries, *zip(*plan)))
+
+        with self._con_transaction() as staging:
+            for (reader, args), (entries, elapsed) in zip(plan, results):
+                report.files.append(self._con_load_file(READER_FORMATS[reader], args[0], entries, elapsed))
+
+            # The locales of the chain would be parsed as soon as the tables are published.
+            active = self._sc_snapshot.locales
+
+            for locale_, locale_plan in pending.items():
+                if staging.get(locale_, None) or locale_ in active:
+                    for reader, args in locale_plan:
+                        entries = ((locale_, key, text) for locale, key, text in reader(*args)
+                                   if locale == locale_ or (isinstance(locale, list) and locale_ in locale))
+                        report.files.append(self._con_load_file(READER_FORMATS[reader], args[0], entries))
+
+                else:
+                    self._con_staging_assign(locale_, I18nLazyTable(locale_, locale_plan))
+                    report.deferred.extend(args[0] for _, args in locale_plan)
+
+        report.elapsed = time.perf_counter() - started
+        return report
+
+
+class I18nWatcher (object):
+    """
+    ## Translation file watcher
+
+    Polls the modification time of every file `con_auto_load` would read and re-parses only the changed files.
+    The first poll loads the files like `con_auto_load`, later polls apply the changed keys in one transaction,
+    resolved in load order like a full reload. Keys removed from a file fall back to the other watched files
+    or are removed. Only the keys of every file are kept, texts are read from the files again when needed.
+    """
+
+    def __init__(self, i18n: BaseI18n, path: str, locale: LocaleCode = ..., interval: float = 1.0) -> None:
+        self._i18n = i18n
+        self._path = path
+        self._locale = locale
+        self._interval = interval
+
+        self._stamps: Dict[str, Tuple[int, int]] = {}
+        # The keys of every file, the files that define every key and the position of every file in load order.
+        self._keys: Dict[str, Dict[LocaleCode, List[TextKey]]] = {}
+        self._files: Dict[LocaleCode, Dict[TextKey, List[str]]] = {}
+        self._order: Dict[str, int] = {}
+
+        self._event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @staticmethod
+    def _parse(reader: Callable[..., Iterable[tuple]], args: tuple) -> Dict[LocaleCode, Dict[TextKey, str]]:
+        result: Dict[LocaleCode, Dict[TextKey, str]] = {}
+        for locale, key, text in reader(*args):
+            for locale_ in (locale if isinstance(locale, list) else (locale,)):
+                result.setdefault(locale_, {})[key] = text
+
+        return result
+
+    def _resolve(self, locale: LocaleCode, key: TextKey) -> Optional[str]:
+        # The last file in load order that defines the key.
+        files = self._files.get(locale, {}).get(key, None)
+        if not files:
+            return None
+
+        return files[0] if len(files) == 1 else max(files, key=self._order.__getitem__)
+
+    def _index(self, file_path: str, entries: Dict[LocaleCode, Dict[TextKey, str]]) -> None:
+        # Replaces the keys of a file in the index.
+        for locale, keys in self._keys.pop(file_path, {}).items():
+            files = self._files[locale]
+            for key in keys:
+                definers = files[key]
+                definers.remove(file_path)
+                if not definers:
+                    del files[key]
+
+        if not entries:
+            return
+
+        self._keys[file_path] = {locale: list(table) for locale, table in entries.items()}
+
+        for locale, table in entries.items():
+            files = self._files.setdefault(locale, {})
+            for key in table:
+                definers = files.get(key, None)
+                if definers is None:
+                    files[key] = [file_path]
+                else:
+                    definers.append(file_path)
+
+    def poll(self) -> int:
+        """
+        ## Check the files once
+
+        Returns the number of files that changed.
+        """
+        plan = I18nAutoLoad._con_auto_load_plan(self._path, self._locale)
+        changed: Dict[str, Dict[LocaleCode, Dict[TextKey, str]]] = {}
+        stamps: Dict[str, Tuple[int, int]] = {}
+
+        for reader, args in plan:
+            file_path = args[0]
+            try:
+                stat = os.stat(file_path)
+
+            except OSError as _:
+                continue
+
+            stamp = (stat.st_mtime_ns, stat.st_size)
+            if self._stamps.get(file_path, None) == stamp:
+                stamps[file_path] = stamp
+                continue
+
+            try:
+                changed[file_path] = self._parse(reader, args)
+
+            except (OSError, ValueError, UnicodeDecodeError) as _:
+                # Probably still being written, keep the old entries and try again next time.
+                if file_path in self._stamps:
+                    stamps[file_path] = self._stamps[file_path]
+                continue
+
+            stamps[file_path] = stamp
+
+        for file_path in self._stamps:
+            if file_path not in stamps:
+                changed[file_path] = {}
+
+        if not changed:
+            return 0
+
+        order = {args[0]: position for position, (_, args) in enumerate(plan)}
+        readers = {args[0]: (reader, args) for reader, args in plan}
+        i18n = self._i18n
+
+        with i18n._con_transaction():
+            if not self._keys:
+                # Nothing is loaded yet, load in plan order like `con_auto_load`.
+                self._order = order
+                for file_path, entries in changed.items():
+                    i18n._con_add_entries(
+                        (locale, key, text) for locale, table in entries.items() for key, text in table.items())
+                    self._index(file_path, entries)
+
+            else:
+                self._apply(changed, order, readers)
+
+            self._stamps = stamps
+
+        return len(changed)
+
+    def _apply(self, changed: Dict[str, Dict[LocaleCode, Dict[TextKey, str]]], order: Dict[str, int],
+               readers: Dict[str, Tuple[Callable[..., Iterable[tuple]], tuple]]) -> None:
+        # Must be called inside a transaction. Only the keys of the changed files are resolved again.
+        i18n = self._i18n
+        affected: Dict[LocaleCode, Set[TextKey]] = {}
+
+        for file_path, entries in changed.items():
+            for locale, keys in itertools.chain(self._keys.get(file_path, {}).items(), entries.items()):
+                affected.setdefault(locale, set()).update(keys)
+
+        previous = {locale: {key: self._resolve(locale, key) for key in keys} for locale, keys in affected.items()}
+
+        for file_path, entries in changed.items():
+            self._index(file_path, entries)
+
+        self._order = order
+        parsed = dict(changed)
+
+        for locale, keys in affected.items():
+            table = None
+
+            for key in keys:
+                winner = self._resolve(locale, key)
+
+                if winner is None:
+                    text = None
+
+                elif winner in changed:
+                    text = changed[winner][locale][key]
+
+                elif winner == previous[locale][key]:
+                    # An unchanged file still wins, the table already holds its text.
+                    continue
+
+                else:
+                    # A key of an edited file falls back to an unchanged file, read that file again.
+                    entries = parsed.get(winner, None)
+                    if entries is None:
+                        try:
+                            entries = parsed[winner] = self._parse(*readers[winner])
+
+                        except (OSError, ValueError, UnicodeDecodeError) as _:
+                            continue
+
+                    text = entries.get(locale, {}).get(key, None)
+
+                if table is None:
+                    table = i18n._con_staging_table(locale)
+
+                i18n._con_staging_touch(key)
+
+                if text is None:
+                    table.pop(key, None)
+                else:
+                    table[intern_key(key)] = text
+
+    def _run(self) -> None:
+        while not self._event.wait(self._interval):
+            try:
+                self.poll()
+
+            except Exception as _:
+                # e.g. the directory is being swapped during a deploy, try again next time.
+                import logging
+                logging.getLogger(__name__).exception("i18nco watcher failed to poll %s", self._path)
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+
+        self._event.clear()
+        self._thread = threading.Thread(target=self._run, name="i18nco-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+
+        self._event.set()
+        self._thread.join()
+        self._thread = None
+
+
+class I18nWatchLoad (I18nComponent):
+    def con_watch(self, path: str, *, locale: LocaleCode = ..., interval: float = 1.0,
+                  start: bool = True) -> I18nWatcher:
+        """
+        ## Load a directory and keep it up to date
+
+        Loads the directory like `con_auto_load` and returns the watcher that applies later edits.
+        The watcher polls every `interval` seconds in a daemon thread,
+        with `start=False` call `poll()` yourself.
+        """
+        self: BaseI18n
+        watcher = I18nWatcher(self, path, locale, interval)
+        watcher.poll()
+
+        if start:
+            watcher.start()
+
+        return watcher
+
 
 __all__ = [
     "I18nCSVLoad",
     "I18nJsonLoad",
     "I18nLangLoad",
-    "I18nAutoLoad"
+    "I18nCatalogLoad",
+    "I18nAutoLoad",
+    "I18nWatchLoad",
+    "I18nWatcher"
 ]
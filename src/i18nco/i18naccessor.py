@@ -0,0 +1,44 @@
+# Licensed under the LGPL 3.0 License.
+# i18nco by numlinka.
+
+# std
+from typing import *
+
+# self
+from .schemas import *
+from .i18nstring import I18nString
+from .i18nabstract import AbstractI18n
+
+
+class I18nAccessor (object):
+    """
+    ## Bound translation accessor
+
+    Holds an already resolved dotted key, calling it returns the current translation
+    without walking the attribute chain again. It can also be used as a class attribute.
+    """
+
+    __slots__ = ("_key", "_translation")
+
+    def __init__(self, visit: AbstractI18n, key: TextKey) -> None:
+        self._key = key
+        self._translation = visit.con_translation
+
+    @property
+    def key(self) -> TextKey:
+        return self._key
+
+    def __call__(self) -> I18nString:
+        return self._translation(self._key)
+
+    def __get__(self, instance: object, owner: type = None) -> I18nString:
+        return self._translation(self._key)
+
+    def __str__(self) -> str:
+        return str(self._translation(self._key))
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._key!r})"
+
+
+__all__ = ["I18nAccessor"]
@@ -3,54 +3,246 @@
 
 # std
 import threading
+import contextlib
+import contextvars
 from typing import *
 
 # self
+from .utils import intern_key
 from .schemas import *
-from .constants import *
 from .i18nstring import I18nString
 from .i18nabstract import AbstractI18n
+from .i18naccessor import I18nAccessor
+from .i18nsnapshot import I18nSnapshot, INCREMENTAL_MERGE_LIMIT, MISS_CACHE_LIMIT, OVERLAY_LIMIT
+
+if TYPE_CHECKING:
+    from .i18nmetrics import I18nMetrics
+
+
+# Fallback chain of a new instance.
+DEFAULT_LOCALES: Tuple[LocaleCode, ...] = ("en_US", "zh_CN")
+
+# Bypasses the `__getattribute__` override of `BaseI18n` on the lookup path.
+_getattribute = object.__getattribute__
 
 
 class BaseI18n (AbstractI18n):
     def __init__(self) -> None:
         self._lock = threading.RLock()
 
-        self._sc_first_locale: LocaleCode = en_US
-        self._sc_second_locale: LocaleCode = zh_CN
+        # Readers only ever load this reference, writers publish a new snapshot under the lock.
+        self._sc_snapshot = I18nSnapshot({}, DEFAULT_LOCALES)
 
-        self._sc_translation: Dict[LocaleCode: Dict[TextKey: str]] = {}
+        # Fallback chain of the current context, None means the chain of the snapshot is used.
+        self._sc_context_locale: contextvars.ContextVar[Optional[Tuple[LocaleCode, ...]]] = \
+            contextvars.ContextVar(f"i18nco_locale_{id(self)}", default=None)
 
-    def con_set_locale(self, first_language: LocaleCode = ..., second_language: LocaleCode = ...) -> None:
+        self._sc_staging: Optional[Dict[LocaleCode, Dict[TextKey, str]]] = None
+        self._sc_staging_copied: Set[LocaleCode] = set()
+        self._sc_staging_changed: Set[LocaleCode] = set()
+        self._sc_staging_keys: Optional[Set[TextKey]] = set()
+        self._sc_transaction_depth = 0
+
+        self._sc_miss_count = 0
+        self._sc_metrics: Optional["I18nMetrics"] = None
+
+    @contextlib.contextmanager
+    def _con_transaction(self) -> Iterator[Dict[LocaleCode, Dict[TextKey, str]]]:
+        """
+        ## Translation write transaction
+
+        All writes inside the block are staged on a copy of the current tables
+        and published as a single new snapshot when the outermost block exits.
+        If the outermost block raises, the staged writes are discarded and nothing is published.
+        The overlay of single writes is folded into the staged tables.
+        """
+        with self._lock:
+            if self._sc_transaction_depth == 0:
+                snapshot = self._sc_snapshot
+                self._sc_staging = dict(snapshot.translation)
+                self._sc_staging_copied = set()
+                self._sc_staging_changed = set()
+                self._sc_staging_keys = set()
+
+                for locale, table in snapshot.overlay.items():
+                    self._con_staging_touch_many(table)
+                    self._con_staging_table(locale).update(table)
+
+            self._sc_transaction_depth += 1
+            completed = False
+
+            try:
+                yield self._sc_staging
+                completed = True
+
+            finally:
+                self._sc_transaction_depth -= 1
+
+                if self._sc_transaction_depth == 0:
+                    if completed:
+                        self._sc_snapshot = self._sc_snapshot.apply(
+                            self._sc_staging, self._sc_staging_changed, self._sc_staging_keys)
+
+                    self._sc_staging = None
+                    self._sc_staging_copied = set()
+                    self._sc_staging_changed = set()
+                    self._sc_staging_keys = set()
+
+    def _con_staging_table(self, locale: LocaleCode) -> Dict[TextKey, str]:
+        # Must be called inside `_con_transaction`.
+        if locale not in self._sc_staging_copied:
+            self._sc_staging[locale] = dict(self._sc_staging.get(locale, {}))
+            self._sc_staging_copied.add(locale)
+            self._sc_staging_changed.add(locale)
+
+        return self._sc_staging[locale]
+
+    def _con_staging_assign(self, locale: LocaleCode, table: Mapping[TextKey, str]) -> None:
+        # Must be called inside `_con_transaction`. Replaces the whole table of a locale,
+        # the table is only copied if it is written to later in the same transaction.
+        self._sc_staging[locale] = table
+        self._sc_staging_copied.discard(locale)
+        self._sc_staging_changed.add(locale)
+        self._sc_staging_keys = None
+
+    def _con_staging_touch(self, key: TextKey) -> None:
+        # Remember written keys so the merged table can be patched instead of rebuilt.
+        if self._sc_staging_keys is None:
+            return
+
+        self._sc_staging_keys.add(key)
+
+        if len(self._sc_staging_keys) > INCREMENTAL_MERGE_LIMIT:
+            self._sc_staging_keys = None
+
+    def _con_staging_touch_many(self, keys: Iterable[TextKey]) -> None:
+        if self._sc_staging_keys is None:
+            return
+
+        self._sc_staging_keys.update(keys)
+
+        if len(self._sc_staging_keys) > INCREMENTAL_MERGE_LIMIT:
+            self._sc_staging_keys = None
+
+    @staticmethod
+    def _con_locale_pair(first_locale: LocaleCode, second_locale: LocaleCode,
+                         first_language: LocaleCode = ..., second_language: LocaleCode = ...
+                         ) -> Tuple[LocaleCode, LocaleCode]:
         if isinstance(first_language, LocaleCode) and first_language == second_language:
             raise ValueError("first_language and second_language must be different.")
 
         if isinstance(first_language, LocaleCode):
-            with self._lock:
-                if first_language == self._sc_second_locale:
-                    self._sc_first_locale, self._sc_second_locale = \
-                        self._sc_second_locale, self._sc_first_locale
-                    return
+            if first_language == second_locale:
+                return second_locale, first_locale
 
-                self._sc_first_locale = first_language
+            first_locale = first_language
 
         if isinstance(second_language, LocaleCode):
-            with self._lock:
-                if second_language == self._sc_first_locale:
-                    self._sc_first_locale, self._sc_second_locale = \
-                        self._sc_second_locale, self._sc_first_locale
-                    return
+            if second_language == first_locale:
+                return second_locale, first_locale
+
+            second_locale = second_language
+
+        return first_locale, second_locale
+
+    @classmethod
+    def _con_locale_chain(cls, locales: Tuple[LocaleCode, ...], first_language: LocaleCode = ...,
+                          second_language: LocaleCode = ...) -> Tuple[LocaleCode, ...]:
+        # Applies the `con_set_locale` rules to the head of a fallback chain, the tail is kept.
+        first_locale, second_locale = cls._con_locale_pair(
+            locales[0], locales[1] if len(locales) > 1 else None, first_language, second_language)
+
+        head = tuple(locale for locale in (first_locale, second_locale) if locale is not None)
+        return head + tuple(locale for locale in locales[2:] if locale not in head)
+
+    @staticmethod
+    def _con_check_chain(locales: Iterable[LocaleCode]) -> Tuple[LocaleCode, ...]:
+        locales = tuple(locales)
+
+        if not locales:
+            raise ValueError("the fallback chain must contain at least one locale.")
+
+        if not all(isinstance(locale, LocaleCode) for locale in locales):
+            raise TypeError("locale must be LocaleCode (str).")
+
+        if len(set(locales)) != len(locales):
+            raise ValueError("the locales of the fallback chain must be different.")
+
+        return locales
 
-                self._sc_second_locale = second_language
+    def _con_snapshot(self) -> I18nSnapshot:
+        # The snapshot as seen from the current context.
+        snapshot = self._sc_snapshot
+        locales = self._sc_context_locale.get()
+
+        if locales is None:
+            return snapshot
+
+        return snapshot.derive(locales)
+
+    def con_set_locale(self, first_language: LocaleCode = ..., second_language: LocaleCode = ...) -> None:
+        with self._lock:
+            snapshot = self._sc_snapshot
+            locales = self._con_locale_chain(snapshot.locales, first_language, second_language)
+            self._sc_snapshot = snapshot.replace(locales=locales)
+
+    def con_set_fallback_chain(self, locales: Iterable[LocaleCode]) -> None:
+        """
+        ## Set the fallback chain
+
+        A key is looked up in each locale in order, e.g. `["zh_HK", "zh_TW", "zh_CN", "en_US"]`.
+        The first two locales are the ones `con_set_locale` works on.
+        """
+        locales = self._con_check_chain(locales)
+
+        with self._lock:
+            self._sc_snapshot = self._sc_snapshot.replace(locales=locales)
+
+    def con_get_fallback_chain(self) -> LocaleCodeList:
+        return list(self._con_snapshot().locales)
+
+    @contextlib.contextmanager
+    def _con_use_chain(self, locales: Tuple[LocaleCode, ...]) -> Iterator[None]:
+        token = self._sc_context_locale.set(locales)
+
+        try:
+            yield
+
+        finally:
+            self._sc_context_locale.reset(token)
+
+    def con_use_locale(self, first_language: LocaleCode = ...,
+                       second_language: LocaleCode = ...) -> ContextManager[None]:
+        """
+        ## Use a locale in the current context
+
+        Works like `con_set_locale`, but only for the current thread or asyncio task
+        until the block exits. The loaded translations are shared with every other context.
+        """
+        return self._con_use_chain(
+            self._con_locale_chain(self._con_snapshot().locales, first_language, second_language))
+
+    def con_use_fallback_chain(self, locales: Iterable[LocaleCode]) -> ContextManager[None]:
+        """
+        ## Use a fallback chain in the current context
+
+        Works like `con_set_fallback_chain`, but only for the current thread or asyncio task.
+        """
+        return self._con_use_chain(self._con_check_chain(locales))
 
     def con_get_locale(self) -> LocaleCode:
         return self.con_get_first_locale()
 
     def con_get_available_locales(self) -> LocaleCodeList:
-        with self._lock:
-            return list(self._sc_translation.keys())
+        return list(self._sc_snapshot.available_locales())
 
     def con_add_translation(self, locale: Union[LocaleCode, LocaleCodeList], key: TextKey, text: str) -> None:
+        """
+        ## Add a translation
+
+        Outside a transaction the key goes to the overlay of the snapshot, so a single write
+        does not copy the tables. The overlay is folded into the tables once it holds `OVERLAY_LIMIT` entries.
+        """
         if not isinstance(locale, (LocaleCode, list)):
             raise TypeError("locale must be LocaleCode (str).")
 
@@ -60,18 +252,56 @@ class BaseI18n (AbstractI18n):
         if not isinstance(text, str):
             raise TypeError("value must be str.")
 
+        key = intern_key(key)
+        locales = (locale,) if isinstance(locale, LocaleCode) else locale
+
         with self._lock:
-            if isinstance(locale, LocaleCode):
-                if locale not in self._sc_translation:
-                    self._sc_translation[locale] = {}
+            snapshot = self._sc_snapshot
+
+            if self._sc_transaction_depth == 0 and snapshot.overlay_size < OVERLAY_LIMIT:
+                self._sc_snapshot = snapshot.write(locales, key, text)
+                return
+
+            with self._con_transaction():
+                self._con_staging_touch(key)
+
+                for locale_ in locales:
+                    self._con_staging_table(locale_)[key] = text
+
+    def con_add_translations(self, locale: Union[LocaleCode, LocaleCodeList], mapping: Dict[TextKey, str]) -> None:
+        """
+        ## Add many translations at once
+
+        Same as calling `con_add_translation` for every item,
+        but the whole mapping is validated and merged under a single lock acquisition.
+        """
+        if not isinstance(locale, (LocaleCode, list)):
+            raise TypeError("locale must be LocaleCode (str).")
+
+        if not isinstance(mapping, dict):
+            raise TypeError("mapping must be dict.")
+
+        if not all(isinstance(key, TextKey) for key in mapping):
+            raise TypeError("key must be TextKey (str).")
+
+        if not all(isinstance(text, str) for text in mapping.values()):
+            raise TypeError("value must be str.")
+
+        if not mapping:
+            return
+
+        # Every locale shares the same key objects instead of holding its own copies.
+        mapping = dict(zip(map(intern_key, mapping.keys()), mapping.values()))
+
+        with self._con_transaction():
+            self._con_staging_touch_many(mapping)
 
-                self._sc_translation[locale][key] = text
+            if isinstance(locale, LocaleCode):
+                self._con_staging_table(locale).update(mapping)
                 return
 
             for locale_ in locale:
-                if locale_ not in self._sc_translation:
-                    self._sc_translation[locale_] = {}
-                self._sc_translation[locale_][key] = text
+                self._con_staging_table(locale_).update(mapping)
 
     def _con_get_self_translation(self, target: TextKey) -> str:
         try:
@@ -88,28 +318,138 @@ class BaseI18n (AbstractI18n):
 
         return result
 
-    def con_translation(self, key: TextKey) -> I18nString:
-        with self._lock:
-
-            table = self._sc_translation.get(self._sc_first_locale, {})
-            result = table.get(key, None)
+    def _con_translate(self, snapshot: I18nSnapshot, key: TextKey) -> I18nString:
+        reply = snapshot.strings.get(key, None)
+        if reply is not None:
+            return reply
 
-            if result is None:
-                table = self._sc_translation.get(self._sc_second_locale, {})
-                result = table.get(key, None)
+        reply = snapshot.misses.get(key, None)
+        if reply is not None:
+            self._sc_miss_count += 1
+            return reply
 
-            if result is None:
-                result = self._con_get_self_translation(key)
+        result = snapshot.patch.get(key, None)
+        if result is None:
+            result = snapshot.merged.get(key, None)
 
+        if result is None:
+            result = self._con_get_self_translation(key)
             reply = I18nString(result)
             reply.con_set_attribute(self, key)
+
+            if len(snapshot.misses) >= MISS_CACHE_LIMIT:
+                snapshot.misses.clear()
+
+            snapshot.misses[key] = reply
             return reply
 
+        reply = I18nString(result)
+        reply.con_set_attribute(self, key)
+        snapshot.strings[key] = reply
+        return reply
+
+    def con_translation(self, key: TextKey) -> I18nString:
+        # Hot path: every attribute is loaded once, without going through `__getattribute__`.
+        snapshot = _getattribute(self, "_sc_snapshot")
+        locales = _getattribute(self, "_sc_context_locale").get()
+
+        if locales is not None:
+            snapshot = snapshot.derive(locales)
+
+        metrics = _getattribute(self, "_sc_metrics")
+        if metrics is None:
+            reply = snapshot.strings.get(key, None)
+            if reply is not None:
+                return reply
+
+            return _getattribute(self, "_con_translate")(snapshot, key)
+
+        return metrics.measure(_getattribute(self, "_con_translate"), snapshot, key)
+
+    def con_enable_metrics(self, sample_every: int = 100, top_missing: int = 20) -> "I18nMetrics":
+        """
+        ## Start collecting lookup metrics
+
+        Counts hits per locale, fallbacks to later locales, self translations and misses,
+        and times one lookup in `sample_every`. Export them with `con_get_metrics`.
+        """
+        from .i18nmetrics import I18nMetrics
+
+        metrics = self._sc_metrics = I18nMetrics(sample_every, top_missing)
+        return metrics
+
+    def con_disable_metrics(self) -> None:
+        self._sc_metrics = None
+
+    def con_get_metrics(self) -> Dict[str, Any]:
+        """
+        ## Lookup metrics as a plain dict
+
+        Empty if metrics are not enabled.
+        """
+        metrics = self._sc_metrics
+        return {} if metrics is None else metrics.as_dict()
+
+    def con_keys(self, prefix: TextKey = "") -> List[TextKey]:
+        """
+        ## Keys under a namespace
+
+        `con_keys("errors.http")` returns every key of any locale that is `errors.http`
+        or starts with `errors.http.`, sorted. Lazily loaded locales are only listed once they are loaded.
+        """
+        return self._sc_snapshot.keys_under(prefix)
+
+    def con_subtree(self, prefix: TextKey = "", locale: LocaleCode = ...) -> Dict[TextKey, str]:
+        """
+        ## Translations under a namespace
+
+        Without `locale` the texts are resolved with the active locales, like `con_translation`
+        but without falling back to the key itself. A lazily loaded `locale` is loaded.
+        """
+        # The keys and the texts must come from the same snapshot.
+        snapshot = self._sc_snapshot
+        locales = self._sc_context_locale.get()
+        view = snapshot if locales is None else snapshot.derive(locales)
+
+        if locale is Ellipsis:
+            table = view.resolved()
+
+        else:
+            table = view.table(locale)
+            # Loads a lazy table, so its keys are in the index.
+            len(table)
+
+        result = {}
+        for key in snapshot.keys_under(prefix):
+            text = table.get(key, None)
+            if text is not None:
+                result[key] = text
+
+        return result
+
+    def con_get_miss_count(self) -> int:
+        """
+        ## Number of lookups served from the missing key cache
+        """
+        return self._sc_miss_count
+
+    def con_accessor(self, key: TextKey) -> I18nAccessor:
+        """
+        ## Bound accessor for a dotted key
+
+        `con_accessor("mode.singleton")()` is the same as `i18n.mode.singleton`,
+        but the key is resolved once instead of on every attribute access.
+        """
+        if not isinstance(key, TextKey):
+            raise TypeError("key must be TextKey (str).")
+
+        return I18nAccessor(self, key)
+
     def __getattribute__(self, __name: str) -> Any:
         if __name.startswith("_") or __name.startswith("con_"):
-            return super().__getattribute__(__name)
+            return _getattribute(self, __name)
 
-        return self.con_translation(__name)
+        return _getattribute(self, "con_translation")(__name)
 
 
 __all__ = ["BaseI18n"]
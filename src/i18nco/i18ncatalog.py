@@ -0,0 +1,235 @@
+# Licensed under the LGPL 3.0 License.
+# i18nco by numlinka.
+
+# std
+import os
+import sys
+import mmap
+import tempfile
+import struct
+from typing import *
+from collections.abc import Mapping
+
+# self
+from .schemas import *
+
+
+# File layout:
+#   header | key index | locale table | value index of each locale | string pool
+# Every string is stored once in the pool as utf-8 and referenced by (offset, length).
+MAGIC = b"I18NCO\x00\x01"
+HEADER = struct.Struct("<8sIIQQQ")      # magic, key count, locale count, key index, locale table, pool
+KEY_ENTRY = struct.Struct("<QI")        # pool offset, length
+LOCALE_ENTRY = struct.Struct("<QIQI")   # name pool offset, name length, value index offset, value count
+VALUE_ENTRY = struct.Struct("<IQI")     # key id, pool offset, length
+
+
+def write_catalog(file_path: str, translation: Mapping) -> None:
+    """
+    ## write binary catalog
+
+    Writes the translation tables (`locale -> key -> text`) to a catalog
+    that can be opened with `I18nCatalog`.
+    The catalog is written to a temporary file and moved over `file_path`,
+    processes that still map the old catalog keep reading the old file.
+    """
+    pool = bytearray()
+    pooled: Dict[str, Tuple[int, int]] = {}
+
+    def intern(text: str) -> Tuple[int, int]:
+        reference = pooled.get(text, None)
+        if reference is None:
+            data = text.encode("utf-8")
+            reference = pooled[text] = (len(pool), len(data))
+            pool.extend(data)
+
+        return reference
+
+    keys = sorted(set().union(*(table.keys() for table in translation.values())))
+    key_ids = {key: index for index, key in enumerate(keys)}
+
+    key_index = b"".join(KEY_ENTRY.pack(*intern(key)) for key in keys)
+
+    value_indexes = []
+    for table in translation.values():
+        entries = sorted((key_ids[key], *intern(text)) for key, text in table.items())
+        value_indexes.append(b"".join(VALUE_ENTRY.pack(*entry) for entry in entries))
+
+    key_index_offset = HEADER.size
+    locale_table_offset = key_index_offset + len(key_index)
+    offset = locale_table_offset + LOCALE_ENTRY.size * len(translation)
+
+    locale_table = bytearray()
+    for (locale, table), value_index in zip(translation.items(), value_indexes):
+        locale_table.extend(LOCALE_ENTRY.pack(*intern(locale), offset, len(table)))
+        offset += len(value_index)
+
+    header = HEADER.pack(MAGIC, len(keys), len(translation), key_index_offset, locale_table_offset, offset)
+
+    # Truncating a mapped file in place would crash its readers with SIGBUS.
+    directory = os.path.dirname(os.path.abspath(file_path))
+    descriptor, temp_path = tempfile.mkstemp(prefix=".", suffix=".tmp", dir=directory)
+
+    try:
+        with open(descriptor, "wb") as file_object:
+            file_object.write(header)
+            file_object.write(key_index)
+            file_object.write(locale_table)
+            for value_index in value_indexes:
+                file_object.write(value_index)
+
+            file_object.write(pool)
+
+        os.replace(temp_path, file_path)
+
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+class I18nCatalog (object):
+    """
+    ## Memory-mapped binary catalog
+
+    The file is mapped read-only, so its pages are shared between processes.
+    Single keys are found by binary search in the file, all keys are only decoded when a table is iterated.
+    Texts are decoded every time they are read, the translation cache of the snapshot keeps the looked up ones.
+    """
+
+    def __init__(self, file_path: str) -> None:
+        with open(file_path, "rb") as file_object:
+            self._mmap = mmap.mmap(file_object.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._mmap) < HEADER.size:
+            raise ValueError(f"{file_path} is not an i18nco catalog.")
+
+        magic, self._key_count, locale_count, self._key_index_offset, locale_table_offset, self._pool_offset = \
+            HEADER.unpack_from(self._mmap, 0)
+
+        if magic != MAGIC:
+            raise ValueError(f"{file_path} is not an i18nco catalog.")
+
+        self._keys: Optional[List[TextKey]] = None
+        self.tables: Dict[LocaleCode, I18nCatalogTable] = {}
+
+        for index in range(locale_count):
+            name_offset, name_length, value_offset, value_count = \
+                LOCALE_ENTRY.unpack_from(self._mmap, locale_table_offset + index * LOCALE_ENTRY.size)
+
+            locale = self.text(name_offset, name_length)
+            self.tables[locale] = I18nCatalogTable(self, value_offset, value_count)
+
+    def text(self, offset: int, length: int) -> str:
+        start = self._pool_offset + offset
+        return self._mmap[start: start + length].decode("utf-8")
+
+    def keys(self) -> List[TextKey]:
+        keys = self._keys
+        if keys is None:
+            end = self._key_index_offset + self._key_count * KEY_ENTRY.size
+            data = self._mmap[self._key_index_offset: end]
+            keys = self._keys = [sys.intern(self.text(*entry)) for entry in KEY_ENTRY.iter_unpack(data)]
+
+        return keys
+
+    def entries(self, offset: int, count: int) -> Iterator[Tuple[int, int, int]]:
+        return VALUE_ENTRY.iter_unpack(self._mmap[offset: offset + count * VALUE_ENTRY.size])
+
+    def key_id(self, key: TextKey) -> Optional[int]:
+        # Binary search of the sorted key index, utf-8 bytes sort like the code points they encode.
+        try:
+            data = key.encode("utf-8")
+
+        except UnicodeEncodeError as _:
+            return None
+
+        low, high = 0, self._key_count
+        while low < high:
+            middle = (low + high) // 2
+            offset, length = KEY_ENTRY.unpack_from(self._mmap, self._key_index_offset + middle * KEY_ENTRY.size)
+            start = self._pool_offset + offset
+            candidate = self._mmap[start: start + length]
+
+            if candidate < data:
+                low = middle + 1
+            elif candidate > data:
+                high = middle
+            else:
+                return middle
+
+        return None
+
+    def find(self, offset: int, count: int, key_id: int) -> Optional[Tuple[int, int]]:
+        # Binary search of a value index, the entries are sorted by key id.
+        low, high = 0, count
+        while low < high:
+            middle = (low + high) // 2
+            entry_id, text_offset, length = VALUE_ENTRY.unpack_from(self._mmap, offset + middle * VALUE_ENTRY.size)
+
+            if entry_id < key_id:
+                low = middle + 1
+            elif entry_id > key_id:
+                high = middle
+            else:
+                return text_offset, length
+
+        return None
+
+
+class I18nCatalogTable (Mapping):
+    """
+    ## Read-only translation table of one catalog locale
+
+    `mapped` tells snapshots to resolve the table through the fallback chain
+    instead of copying every text into their merged table.
+    """
+
+    mapped = True
+
+    def __init__(self, catalog: I18nCatalog, offset: int, count: int) -> None:
+        self._catalog = catalog
+        self._offset = offset
+        self._count = count
+        self._index: Optional[Dict[TextKey, Tuple[int, int]]] = None
+
+    def _get_index(self) -> Dict[TextKey, Tuple[int, int]]:
+        index = self._index
+        if index is None:
+            keys = self._catalog.keys()
+            index = self._index = {
+                keys[key_id]: (offset, length)
+                for key_id, offset, length in self._catalog.entries(self._offset, self._count)
+            }
+
+        return index
+
+    def _find(self, key: object) -> Optional[Tuple[int, int]]:
+        # Single keys are searched in the file until the index is needed for iteration anyway.
+        index = self._index
+        if index is not None:
+            return index.get(key, None)
+
+        if not isinstance(key, str):
+            return None
+
+        key_id = self._catalog.key_id(key)
+        return None if key_id is None else self._catalog.find(self._offset, self._count, key_id)
+
+    def __getitem__(self, key: TextKey) -> str:
+        reference = self._find(key)
+        if reference is None:
+            raise KeyError(key)
+
+        return self._catalog.text(*reference)
+
+    def __contains__(self, key: object) -> bool:
+        return self._find(key) is not None
+
+    def __iter__(self) -> Iterator[TextKey]:
+        return iter(self._get_index())
+
+    def __len__(self) -> int:
+        return self._count
+
+
+__all__ = ["I18nCatalog", "I18nCatalogTable", "write_catalog"]
@@ -0,0 +1,93 @@
+# Licensed under the LGPL 3.0 License.
+# i18nco by numlinka.
+
+# std
+import time
+from typing import *
+from collections import Counter
+
+# self
+from .schemas import *
+from .i18nsnapshot import I18nSnapshot
+
+
+# Maximum number of distinct missing keys that are counted.
+MISSING_KEY_LIMIT = 10000
+
+
+class I18nMetrics (object):
+    """
+    ## Lookup metrics
+
+    Counts where every lookup was answered from and times one lookup in `sample_every`.
+    The counters are updated without a lock, under heavy contention they may undercount slightly.
+    """
+
+    def __init__(self, sample_every: int = 100, top_missing: int = 20) -> None:
+        if sample_every < 1:
+            raise ValueError("sample_every must be at least 1.")
+
+        self.sample_every = sample_every
+        self.top_missing = top_missing
+        self.reset()
+
+    def reset(self) -> None:
+        self.lookups = 0
+        self.hits: Counter = Counter()
+        self.fallbacks = 0
+        self.self_translations = 0
+        self.misses = 0
+        self.missing_keys: Counter = Counter()
+        # Lookups by the bit length of their duration in nanoseconds, bucket n holds durations below 2**n ns.
+        self.latency: Counter = Counter()
+
+    def measure(self, translate: Callable[[I18nSnapshot, TextKey], str], snapshot: I18nSnapshot, key: TextKey) -> str:
+        self.lookups += 1
+
+        if self.lookups % self.sample_every == 0:
+            started = time.perf_counter_ns()
+            reply = translate(snapshot, key)
+            self.latency[(time.perf_counter_ns() - started).bit_length()] += 1
+
+        else:
+            reply = translate(snapshot, key)
+
+        self.record(snapshot, key, reply)
+        return reply
+
+    def record(self, snapshot: I18nSnapshot, key: TextKey, reply: str) -> None:
+        origin = snapshot.origins.get(key, None)
+
+        if origin is None:
+            for locale in snapshot.locales:
+                if key in snapshot.table(locale):
+                    origin = snapshot.origins[key] = locale
+                    break
+
+        if origin is not None:
+            self.hits[origin] += 1
+            if origin != snapshot.locales[0]:
+                self.fallbacks += 1
+
+        elif reply == key:
+            self.misses += 1
+            if key in self.missing_keys or len(self.missing_keys) < MISSING_KEY_LIMIT:
+                self.missing_keys[key] += 1
+
+        else:
+            self.self_translations += 1
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "lookups": self.lookups,
+            "hits": dict(self.hits),
+            "fallbacks": self.fallbacks,
+            "self_translations": self.self_translations,
+            "misses": self.misses,
+            "missing_keys": self.missing_keys.most_common(self.top_missing),
+            "sample_every": self.sample_every,
+            "latency_ns": {2 ** bucket: count for bucket, count in sorted(self.latency.items())}
+        }
+
+
+__all__ = ["I18nMetrics", "MISSING_KEY_LIMIT"]
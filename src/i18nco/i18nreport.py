@@ -0,0 +1,107 @@
+# Licensed under the LGPL 3.0 License.
+# i18nco by numlinka.
+
+# std
+from typing import *
+
+# self
+from .schemas import *
+
+
+class FileLoadReport (object):
+    """
+    ## What loading one file did
+
+    `elapsed` is the time in seconds spent reading, parsing and merging the file,
+    `overwritten` the number of entries that replaced an existing text.
+    """
+
+    __slots__ = ("file_path", "format", "bytes", "elapsed", "entries", "overwritten", "locales")
+
+    def __init__(self, file_path: str, format: str, bytes: int = 0, elapsed: float = 0.0, entries: int = 0,
+                 overwritten: int = 0, locales: Optional[Set[LocaleCode]] = None) -> None:
+        self.file_path = file_path
+        self.format = format
+        self.bytes = bytes
+        self.elapsed = elapsed
+        self.entries = entries
+        self.overwritten = overwritten
+        self.locales = set() if locales is None else locales
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "file_path": self.file_path,
+            "format": self.format,
+            "bytes": self.bytes,
+            "elapsed": self.elapsed,
+            "entries": self.entries,
+            "overwritten": self.overwritten,
+            "locales": sorted(self.locales)
+        }
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.file_path!r}, {self.format!r}, " \
+               f"elapsed={self.elapsed:.6f}, entries={self.entries})"
+
+
+class LoadReport (object):
+    """
+    ## What a load call did
+
+    Returned by the loaders, `con_auto_load` reports every file of the tree.
+    Files deferred by lazy loading are listed in `deferred` and were not parsed.
+    """
+
+    def __init__(self) -> None:
+        self.files: List[FileLoadReport] = []
+        self.deferred: List[str] = []
+        self.elapsed = 0.0
+
+    @property
+    def bytes(self) -> int:
+        return sum(file.bytes for file in self.files)
+
+    @property
+    def entries(self) -> int:
+        return sum(file.entries for file in self.files)
+
+    @property
+    def overwritten(self) -> int:
+        return sum(file.overwritten for file in self.files)
+
+    @property
+    def locales(self) -> Set[LocaleCode]:
+        return set().union(*(file.locales for file in self.files))
+
+    def by_format(self) -> Dict[str, Dict[str, Union[int, float]]]:
+        result: Dict[str, Dict[str, Union[int, float]]] = {}
+        for file in self.files:
+            total = result.setdefault(file.format, {"files": 0, "bytes": 0, "elapsed": 0.0, "entries": 0})
+            total["files"] += 1
+            total["bytes"] += file.bytes
+            total["elapsed"] += file.elapsed
+            total["entries"] += file.entries
+
+        return result
+
+    def slowest(self, count: int = 10) -> List[FileLoadReport]:
+        return sorted(self.files, key=lambda file: file.elapsed, reverse=True)[:count]
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "elapsed": self.elapsed,
+            "bytes": self.bytes,
+            "entries": self.entries,
+            "overwritten": self.overwritten,
+            "locales": sorted(self.locales),
+            "formats": self.by_format(),
+            "files": [file.as_dict() for file in self.files],
+            "deferred": list(self.deferred)
+        }
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(files={len(self.files)}, elapsed={self.elapsed:.6f}, " \
+               f"entries={self.entries})"
+
+
+__all__ = ["FileLoadReport", "LoadReport"]
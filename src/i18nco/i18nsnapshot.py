@@ -0,0 +1,289 @@
+# Licensed under the LGPL 3.0 License.
+# i18nco by numlinka.
+
+# std
+import bisect
+from typing import *
+from collections import ChainMap
+
+# self
+from .schemas import *
+
+
+# Above this many changed keys the merged table is rebuilt instead of patched.
+INCREMENTAL_MERGE_LIMIT = 4096
+
+# Maximum number of missing keys remembered by a snapshot.
+MISS_CACHE_LIMIT = 1024
+
+# Above this many overlay entries single writes are folded into the tables by a transaction.
+OVERLAY_LIMIT = 256
+
+
+class I18nSnapshot (object):
+    """
+    ## Immutable translation snapshot
+
+    A snapshot is never modified after it has been published,
+    writers build a new one and swap the reference, so readers can use it without a lock.
+
+    `locales` is the fallback chain, the first locale that has a key wins.
+    `merged` maps every key to its text for the whole chain,
+    so a hit costs a single dict lookup whatever the length of the chain.
+    If a table of the chain is `mapped` (a binary catalog), `merged` is a ChainMap of the tables instead,
+    so the texts stay in the shared pages and only the ones looked up are decoded and cached.
+    `overlay` holds single writes made outside a transaction on top of `translation`,
+    and `patch` their text for the whole chain, which takes precedence over `merged`.
+    They let a single write share the tables instead of copying them.
+    `strings`, `misses`, `derived`, `index` and `origins` are the only mutable parts, they cache
+    the ready-made results, the keys found in no locale, the views for other chains, the sorted keys
+    and the locale each key came from of this snapshot and are dropped together with it.
+    """
+
+    __slots__ = ("translation", "locales", "merged", "overlay", "overlay_size", "patch",
+                 "strings", "misses", "derived", "index", "origins")
+
+    def __init__(self, translation: Dict[LocaleCode, Dict[TextKey, str]], locales: Tuple[LocaleCode, ...],
+                 merged: Optional[Dict[TextKey, str]] = None,
+                 overlay: Optional[Dict[LocaleCode, Dict[TextKey, str]]] = None, overlay_size: int = 0,
+                 patch: Optional[Dict[TextKey, str]] = None) -> None:
+        self.translation = translation
+        self.locales = locales
+
+        if merged is None:
+            tables = [translation.get(locale, {}) for locale in locales]
+
+            if any(getattr(table, "mapped", False) for table in tables):
+                merged = ChainMap(*tables)
+
+            else:
+                merged = {}
+                for table in reversed(tables):
+                    merged.update(table)
+
+        self.merged = merged
+        self.overlay = {} if overlay is None else overlay
+        self.overlay_size = overlay_size
+
+        if patch is None:
+            patch = {}
+            for table in self.overlay.values():
+                for key in table:
+                    text = self._resolve(key)
+                    if text is not None:
+                        patch[key] = text
+
+        self.patch = patch
+        self.strings: Dict[TextKey, Any] = {}
+        self.misses: Dict[TextKey, Any] = {}
+        self.derived: Dict[Tuple[LocaleCode, ...], "I18nSnapshot"] = {}
+        self.index: Optional[Tuple[int, List[TextKey]]] = None
+        self.origins: Dict[TextKey, LocaleCode] = {}
+
+    @property
+    def first_locale(self) -> LocaleCode:
+        return self.locales[0]
+
+    @property
+    def second_locale(self) -> Optional[LocaleCode]:
+        return self.locales[1] if len(self.locales) > 1 else None
+
+    def _resolve(self, key: TextKey) -> Optional[str]:
+        # The text of the key for the whole chain, overlay included.
+        for locale in self.locales:
+            table = self.overlay.get(locale, None)
+            if table is not None and key in table:
+                return table[key]
+
+            table = self.translation.get(locale, None)
+            if table is not None and key in table:
+                return table[key]
+
+        return None
+
+    def available_locales(self) -> Tuple[LocaleCode, ...]:
+        return tuple(self.translation) + tuple(locale for locale in self.overlay if locale not in self.translation)
+
+    def table(self, locale: LocaleCode) -> Mapping[TextKey, str]:
+        # The table of a locale, overlay included.
+        table = self.translation.get(locale, {})
+        overlay = self.overlay.get(locale, None)
+        return table if overlay is None else ChainMap(overlay, table)
+
+    def resolved(self) -> Mapping[TextKey, str]:
+        # `merged` with the overlay applied.
+        return ChainMap(self.patch, self.merged) if self.patch else self.merged
+
+    def folded(self) -> Dict[LocaleCode, Mapping[TextKey, str]]:
+        # The tables with the overlay applied, only the tables that have overlay entries are copied.
+        translation = dict(self.translation)
+        for locale, overlay in self.overlay.items():
+            table = translation[locale] = dict(translation.get(locale, {}))
+            table.update(overlay)
+
+        return translation
+
+    def replace(self, *, translation: Dict[LocaleCode, Dict[TextKey, str]] = ...,
+                locales: Tuple[LocaleCode, ...] = ...) -> "I18nSnapshot":
+        # The overlay is kept unless the tables are replaced.
+        if translation is not Ellipsis:
+            return I18nSnapshot(translation, self.locales if locales is Ellipsis else locales)
+
+        snapshot = I18nSnapshot(self.translation, self.locales if locales is Ellipsis else locales,
+                                overlay=self.overlay, overlay_size=self.overlay_size)
+        snapshot.index = self.index
+        return snapshot
+
+    def write(self, locales: Iterable[LocaleCode], key: TextKey, text: str) -> "I18nSnapshot":
+        """
+        ## Snapshot with one more key
+
+        The key is only added to the overlay, the tables and the merged tables of this snapshot
+        and of its views are shared, so the cost does not depend on the size of the tables.
+        """
+        overlay = self.overlay.copy()
+        overlay_size = self.overlay_size
+
+        for locale in locales:
+            table = overlay[locale] = dict(overlay.get(locale, {}))
+            overlay_size += key not in table
+            table[key] = text
+
+        snapshot = self._write(overlay, overlay_size, key)
+        for view in list(self.derived.values()):
+            snapshot.derived[view.locales] = view._write(overlay, overlay_size, key)
+
+        return snapshot
+
+    def _write(self, overlay: Dict[LocaleCode, Dict[TextKey, str]], overlay_size: int,
+               key: TextKey) -> "I18nSnapshot":
+        snapshot = I18nSnapshot(self.translation, self.locales, self.merged, overlay, overlay_size, self.patch.copy())
+        text = snapshot._resolve(key)
+
+        # The sorted key index is carried over with the key inserted instead of being rebuilt.
+        index = self.index
+        if index is not None:
+            keys = index[1]
+            position = bisect.bisect_left(keys, key)
+
+            if position == len(keys) or keys[position] != key:
+                keys = keys.copy()
+                keys.insert(position, key)
+                index = (index[0], keys)
+
+        snapshot.index = index
+
+        if text is not None:
+            snapshot.patch[key] = text
+
+        return snapshot
+
+    def keys_under(self, prefix: TextKey) -> List[TextKey]:
+        """
+        ## Keys in a namespace
+
+        Returns the sorted keys of every locale that equal `prefix` or start with `prefix.`,
+        all keys if `prefix` is empty. The sorted key index is built on first use.
+        Lazily loaded locales that are not loaded yet are left out instead of being parsed,
+        the index is rebuilt once they are loaded. Written keys are inserted into the index
+        of the new snapshot, only a transaction that writes too many keys to track rebuilds it.
+        """
+        tables = [table for table in self.translation.values() if getattr(table, "loaded", True)]
+
+        index = self.index
+        if index is None or index[0] != len(tables):
+            index = self.index = (len(tables), sorted(set().union(
+                *(table.keys() for table in tables),
+                *(table.keys() for table in self.overlay.values())
+            )))
+
+        index = index[1]
+
+        if not prefix:
+            return list(index)
+
+        # "/" sorts right after ".", so the namespace is the range [prefix., prefix/).
+        start = bisect.bisect_left(index, prefix)
+        end = bisect.bisect_left(index, prefix + "/", start)
+        return [key for key in index[start:end] if key == prefix or key.startswith(prefix + ".")]
+
+    def derive(self, locales: Tuple[LocaleCode, ...]) -> "I18nSnapshot":
+        """
+        ## View of the same tables for another fallback chain
+
+        The view is built on first use and shared until this snapshot is replaced.
+        """
+        if locales == self.locales:
+            return self
+
+        view = self.derived.get(locales, None)
+
+        if view is None:
+            view = I18nSnapshot(self.translation, locales, overlay=self.overlay, overlay_size=self.overlay_size)
+            view.index = self.index
+            view = self.derived.setdefault(locales, view)
+
+        return view
+
+    def apply(self, translation: Dict[LocaleCode, Dict[TextKey, str]],
+              locales: Set[LocaleCode], keys: Optional[Set[TextKey]]) -> "I18nSnapshot":
+        """
+        ## Publish changed tables
+
+        `locales` are the locales that were written and `keys` the keys that were written,
+        None if there were too many to track. The merged table is patched when possible.
+        `translation` must already contain the overlay, the new snapshot has none.
+        """
+        if locales.isdisjoint(self.locales):
+            snapshot = I18nSnapshot(translation, self.locales, self.merged)
+
+        elif keys is None or not isinstance(self.merged, dict):
+            snapshot = self.replace(translation=translation)
+
+        else:
+            tables = [translation.get(locale, {}) for locale in self.locales]
+            merged = self.merged.copy()
+
+            for key in keys:
+                for table in tables:
+                    if key in table:
+                        merged[key] = table[key]
+                        break
+
+                else:
+                    merged.pop(key, None)
+
+            snapshot = I18nSnapshot(translation, self.locales, merged)
+
+        snapshot.index = self._patch_index(translation, keys)
+        return snapshot
+
+    def _patch_index(self, translation: Dict[LocaleCode, Dict[TextKey, str]],
+                     keys: Optional[Set[TextKey]]) -> Optional[Tuple[int, List[TextKey]]]:
+        # The sorted key index with the written keys inserted or removed, None if it has to be rebuilt.
+        index = self.index
+        if index is None or keys is None:
+            return None
+
+        # A lazy table was loaded since the index was built.
+        if index[0] != sum(1 for table in self.translation.values() if getattr(table, "loaded", True)):
+            return None
+
+        tables = [table for table in translation.values() if getattr(table, "loaded", True)]
+        sorted_keys = index[1].copy()
+
+        for key in keys:
+            position = bisect.bisect_left(sorted_keys, key)
+            present = position < len(sorted_keys) and sorted_keys[position] == key
+
+            if any(key in table for table in tables):
+                if not present:
+                    sorted_keys.insert(position, key)
+
+            elif present:
+                del sorted_keys[position]
+
+        return len(tables), sorted_keys
+
+
+__all__ = ["I18nSnapshot", "INCREMENTAL_MERGE_LIMIT", "MISS_CACHE_LIMIT", "OVERLAY_LIMIT"]
@@ -1,27 +1,74 @@
 # Licensed under the LGPL 3.0 License.
 # i18nco by numlinka.
 
+# std
+import re
+import functools
+from typing import *
+
 # self
 from .i18nabstract import AbstractI18n
 
 
+placeholder_re = re.compile(r"\{([^{}]*)\}")
+
+# `sformat` replaces the values one by one when there are this many times more placeholders than values.
+PARTIAL_FORMAT_RATIO = 3
+
+
+@functools.lru_cache(maxsize=4096)
+def compile_template(text: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """
+    ## compile format template
+
+    Splits the text into literal pieces and placeholder names,
+    there is always one more literal than there are names.
+    """
+    pieces = placeholder_re.split(text)
+    return tuple(pieces[0::2]), tuple(pieces[1::2])
+
+
 class I18nString (str):
     __visit = ...
     __prefix = ...
+    __template = None
 
     def con_set_attribute(self, visit: AbstractI18n, prefix: str = ""):
         self.__visit = visit
         self.__prefix = prefix
 
     def sformat(self, *args, **kwargs) -> str:
-        result = self
-        for indexed, value in enumerate(args):
-            result = result.replace("{" + f"{indexed}" + "}", f"{value}")
+        template = self.__template
+        if template is None:
+            template = self.__template = compile_template(str(self))
+
+        literals, names = template
+        if not names or not (args or kwargs):
+            return self
+
+        values = kwargs
+        values.update(zip(map(str, range(len(args))), args))
+
+        if len(values) * PARTIAL_FORMAT_RATIO <= len(names):
+            # Few values for many placeholders, a replace per value is cheaper than walking every placeholder.
+            # Values that contain a brace could create new placeholders, they take the template path.
+            result = str(self)
+            for name, value in values.items():
+                text = f"{value}"
+                if "{" in text:
+                    break
+
+                result = result.replace("{" + name + "}", text)
+
+            else:
+                return result
 
-        for key, value in kwargs.items():
-            result = result.replace("{" + f"{key}" + "}", f"{value}")
+        parts = [literals[0]]
+        for name, literal in zip(names, literals[1:]):
+            parts.append(f"{values[name]}" if name in values else "{" + name + "}")
+            parts.append(literal)
 
-        return result
+        return "".join(parts)
 
     def __getattr__(self, __name: str):
         target = __name if self.__prefix == "" else f"{self.__prefix}.{__name}"
@@ -2,16 +2,55 @@
 # i18nco by numlinka.
 
 # std
-# from typing import *
+import functools
+from typing import *
 
 # self
 from .utils import *
 from .schemas import *
 from .i18nbase import *
+from .i18nstring import I18nString
 from .components import *
 
 
-class Internationalization (BaseI18n, I18nLangLoad, I18nJsonLoad, I18nCSVLoad, I18nAutoLoad):
+class Internationalization (BaseI18n, I18nLangLoad, I18nJsonLoad, I18nCSVLoad, I18nCatalogLoad, I18nAutoLoad,
+                            I18nWatchLoad):
+    def __init__(self) -> None:
+        super().__init__()
+        # Built on first use, building it imports the writing system tables.
+        self._sc_resolver: Optional[LocaleResolver] = None
+
+    def con_get_locale_resolver(self) -> LocaleResolver:
+        """
+        ## Locale resolver for the available locales
+
+        The resolver is rebuilt only when the available locales change.
+        """
+        resolver = self._sc_resolver
+        available = self._sc_snapshot.available_locales()
+
+        if resolver is None or resolver.available != available:
+            resolver = self._sc_resolver = LocaleResolver(available)
+
+        return resolver
+
+    def con_match_locale(self, target: LocaleCode) -> Union[LocaleCode, None]:
+        """
+        ## Best available locale for a locale code
+
+        Same result as `match_best_locale` with the available locales, but cached.
+        """
+        return self.con_get_locale_resolver().resolve(target)
+
+    def con_negotiate_locales(self, accept_language: str) -> LocaleCodeList:
+        """
+        ## Available locales for an Accept-Language header
+
+        Returns the best available locale of every requested language, ordered by weight,
+        e.g. `de-CH,de;q=0.9,en;q=0.7`. Results are cached per header value.
+        """
+        return list(self.con_get_locale_resolver().negotiate(accept_language))
+
     def con_set_first_locale(self, value: LocaleCode) -> None:
         self.con_set_locale(value)
 
@@ -19,12 +58,41 @@ class Internationalization (BaseI18n, I18nLangLoad, I18nJsonLoad, I18nCSVLoad, I
         self.con_set_locale(..., value)
 
     def con_get_first_locale(self) -> LocaleCode:
-        with self._lock:
-            return self._sc_first_locale
+        return self._con_snapshot().first_locale
 
     def con_get_second_locale(self) -> LocaleCode:
-        with self._lock:
-            return self._sc_second_locale
+        return self._con_snapshot().second_locale
+
+    def con_get_writing_system_chain(self, locale: LocaleCode, *fallbacks: LocaleCode) -> LocaleCodeList:
+        """
+        ## Fallback chain from the writing system table
+
+        The available locales that share a writing system with `locale`, followed by `fallbacks`,
+        ready for `con_set_fallback_chain`.
+        """
+        chain = writing_system_chain(locale, self.con_get_available_locales())
+        chain.extend(fallback for fallback in fallbacks if fallback not in chain)
+        return chain
+
+    def con_translate_many(self, keys: Iterable[TextKey], *,
+                           as_dict: bool = False) -> Union[List[I18nString], Dict[TextKey, I18nString]]:
+        """
+        ## Translate a batch of keys
+
+        All keys are resolved against the same snapshot,
+        so a locale switch during the batch cannot mix two locales in one result.
+        """
+        snapshot = self._con_snapshot()
+        translate = self._con_translate
+
+        metrics = self._sc_metrics
+        if metrics is not None:
+            translate = functools.partial(metrics.measure, translate)
+
+        if as_dict:
+            return {key: translate(snapshot, key) for key in keys}
+
+        return [translate(snapshot, key) for key in keys]
 
     def con_auto_set_best_locale(self) -> None:
         """
@@ -32,14 +100,7 @@ class Internationalization (BaseI18n, I18nLangLoad, I18nJsonLoad, I18nCSVLoad, I
 
         Adjust to the best locale code according to the system environment.
         """
-        system_code = get_locale_code()
-        available_locales = self.con_get_available_locales()
-
-        if system_code in available_locales:
-            self.con_set_locale(system_code)
-            return
-
-        best = match_best_locale(system_code, available_locales)
+        best = self.con_match_locale(get_locale_code())
 
         if best is not None:
             self.con_set_locale(best)
@@ -50,12 +111,8 @@ class Internationalization (BaseI18n, I18nLangLoad, I18nJsonLoad, I18nCSVLoad, I
 
         Adjust to the best locale code based on current settings.
         """
-        first_locale = self.con_get_first_locale()
-        second_locale = self.con_get_second_locale()
-        available_locales = self.con_get_available_locales()
-
-        best_first_locale = match_best_locale(first_locale, available_locales)
-        best_second_locale = match_best_locale(second_locale, available_locales)
+        best_first_locale = self.con_match_locale(self.con_get_first_locale())
+        best_second_locale = self.con_match_locale(self.con_get_second_locale())
 
         if best_first_locale is not None:
             self.con_set_first_locale(best_first_locale)
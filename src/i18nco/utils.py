@@ -4,43 +4,86 @@
 # std
 import os
 import re
-from typing import Union
+import sys
+import functools
+from typing import Dict, Iterable, Iterator, List, Tuple, Union
 
 # self
 from .schemas import *
-from .constants import *
 
 
 escape_sequence_re = re.compile(r'\\(u[0-9A-Fa-f]{4}|U[0-9A-Fa-f]{8}|x[0-9A-Fa-f]{2}|.)')
 
 
+# Escapes that map to a single character, every other single character escape maps to itself.
+simple_escape_table = {
+    "n": "\n",
+    "t": "\t",
+    "b": "\b",
+    "r": "\r",
+    "f": "\f",
+    "a": "\a",
+    "v": "\v",
+}
+
+
+def replace_escape(match: re.Match) -> str:
+    escape = match.group(1)
+
+    if len(escape) == 1:
+        return simple_escape_table.get(escape, escape)
+
+    # \uXXXX, \UXXXXXXXX or \xXX
+    return chr(int(escape[1:], 16))
+
+
 def decode_escape_sequences(text: str) -> str:
-    def replace_escape(match):
-        escape = match.group(1)
-        if escape.startswith('u') or escape.startswith('U'):
-            return chr(int(escape[1:], 16))
-        elif escape.startswith('x'):
-            return chr(int(escape[1:], 16))
-        elif escape == 'n':
-            return '\n'
-        elif escape == 't':
-            return '\t'
-        elif escape == 'b':
-            return '\b'
-        elif escape == 'r':
-            return '\r'
-        elif escape == 'f':
-            return '\f'
-        elif escape == 'a':
-            return '\a'
-        elif escape == 'v':
-            return '\v'
-        else:
-            return escape
+    if "\\" not in text:
+        return text
 
     return escape_sequence_re.sub(replace_escape, text)
 
 
+def decode_escape_sequences_many(texts: Iterable[str]) -> List[str]:
+    """
+    ## decode escape sequences of many texts
+
+    Texts without a backslash are returned as they are without calling the decoder.
+    """
+    sub = escape_sequence_re.sub
+    return [sub(replace_escape, text) if "\\" in text else text for text in texts]
+
+
+def intern_key(key: TextKey) -> TextKey:
+    """
+    ## intern text key
+
+    Returns the shared instance of the key, so equal keys of all locales are stored once.
+    """
+    return sys.intern(key if type(key) is str else str(key))
+
+
+def flatten_dict(dictionary: dict, superiors: str = "", result: Dict[TextKey, str] = ...) -> Dict[TextKey, str]:
+    """
+    ## flatten nested dictionary
+
+    Nested keys are joined with "." and values that are neither str nor dict are skipped.
+    """
+    if result is Ellipsis:
+        result = {}
+
+    for key, value in dictionary.items():
+        final_key = f"{superiors}.{key}" if superiors != "" else key
+
+        if isinstance(value, str):
+            result[final_key] = value
+
+        elif isinstance(value, dict):
+            flatten_dict(value, final_key, result)
+
+    return result
+
+
 def get_locale_code() -> LocaleCode:
     """
     ## get system locale code
@@ -52,6 +95,60 @@ def get_locale_code() -> LocaleCode:
     return ors.split(".")[0]
 
 
+def normalize_language_tag(tag: str) -> LocaleCode:
+    """
+    ## normalize language tag
+
+    Converts a BCP 47 tag such as `de-ch` to the locale code form `de_CH`.
+    """
+    parts = tag.strip().replace("-", "_").split("_")
+    result = [parts[0].lower()]
+
+    for part in parts[1:]:
+        if len(part) == 4:
+            result.append(part.title())
+        elif len(part) in (2, 3) and part.isalpha():
+            result.append(part.upper())
+        else:
+            result.append(part)
+
+    return "_".join(result)
+
+
+def parse_accept_language(header: str) -> LocaleCodeList:
+    """
+    ## parse Accept-Language header
+
+    Returns the locale codes ordered by weight, `*` and tags with `q=0` or an invalid weight are left out.
+    """
+    weighted = []
+
+    for index, item in enumerate(header.split(",")):
+        tag, *params = item.split(";")
+        tag = tag.strip()
+
+        if not tag or tag == "*":
+            continue
+
+        weight = 1.0
+        for param in params:
+            name, _, value = param.strip().partition("=")
+            if name.strip() == "q":
+                try:
+                    weight = float(value)
+
+                except ValueError as _:
+                    weight = 0.0
+
+        if weight <= 0:
+            continue
+
+        weighted.append((-weight, index, normalize_language_tag(tag)))
+
+    weighted.sort()
+    return [locale for _, _, locale in weighted]
+
+
 def match_best_locale(target: LocaleCode, available: LocaleCodeList) -> Union[LocaleCode, None]:
     """
     ## match best locale code
@@ -69,6 +166,8 @@ def match_best_locale(target: LocaleCode, available: LocaleCodeList) -> Union[Lo
         if locale.startswith(language_code):
             return locale
 
+    from .constants import WRITING_SYSTEM_TABLE
+
     for _, table in WRITING_SYSTEM_TABLE.items():
         if target in table:
             break
@@ -83,6 +182,80 @@ def match_best_locale(target: LocaleCode, available: LocaleCodeList) -> Union[Lo
     return None
 
 
+def writing_system_chain(target: LocaleCode, available: LocaleCodeList = ...) -> LocaleCodeList:
+    """
+    ## fallback chain of a writing system
+
+    Returns the target followed by the other locales of its writing systems,
+    only the available ones if `available` is given.
+    """
+    from .constants import WRITING_SYSTEM_TABLE
+
+    chain = [target]
+
+    for _, table in WRITING_SYSTEM_TABLE.items():
+        if target in table:
+            chain.extend(locale for locale in table if locale not in chain)
+
+    if available is not Ellipsis:
+        chain = [locale for locale in chain if locale in available]
+
+    return chain
+
+
+class LocaleResolver (object):
+    """
+    ## Precomputed locale matcher
+
+    Gives the same answers as `match_best_locale` for a fixed list of available locales,
+    with the prefix and writing system scans done once and recent answers cached.
+    """
+
+    def __init__(self, available: LocaleCodeList, cache_size: int = 1024) -> None:
+        self.available = tuple(available)
+        self._available = frozenset(self.available)
+
+        # Every prefix of every available locale, mapped to the first locale it matches.
+        self._prefix: Dict[str, LocaleCode] = {}
+        for locale in self.available:
+            for end in range(len(locale) + 1):
+                self._prefix.setdefault(locale[:end], locale)
+
+        from .constants import WRITING_SYSTEM_TABLE
+
+        # First available locale of the first writing system that contains the target.
+        self._writing_system: Dict[LocaleCode, Union[LocaleCode, None]] = {}
+        for _, table in WRITING_SYSTEM_TABLE.items():
+            best = next((locale for locale in table if locale in self._available), None)
+            for locale in table:
+                self._writing_system.setdefault(locale, best)
+
+        self.resolve = functools.lru_cache(maxsize=cache_size)(self._resolve)
+        self.negotiate = functools.lru_cache(maxsize=cache_size)(self._negotiate)
+
+    def _resolve(self, target: LocaleCode) -> Union[LocaleCode, None]:
+        if not target or not self.available:
+            return None
+
+        if target in self._available:
+            return target
+
+        best = self._prefix.get(target.split("_")[0], None)
+        if best is not None:
+            return best
+
+        return self._writing_system.get(target, None)
+
+    def _negotiate(self, header: str) -> LocaleCodeList:
+        chain = []
+        for target in parse_accept_language(header):
+            best = self.resolve(target)
+            if best is not None and best not in chain:
+                chain.append(best)
+
+        return chain
+
+
 class InstructionBreakdown (object):
     @staticmethod
     def define(message: str) -> tuple[str, list[str]]:
@@ -104,9 +277,100 @@ class InstructionBreakdown (object):
         return target, values
 
 
+def iter_lang_entries(lines: Iterable[str], locale: Union[LocaleCode, LocaleCodeList],
+                      superiors: str = "") -> Iterator[Tuple[Union[LocaleCode, LocaleCodeList], TextKey, str]]:
+    """
+    ## parse .lang lines
+
+    Yields `(locale, key, text)` for every entry as soon as it is complete,
+    `#define` instructions change the locale and superiors of the following entries.
+    """
+    multiline_mode = False
+    multiline_line = []
+    key = ""
+
+    for line in lines:
+        line = line.strip()
+
+        if not multiline_mode:
+            if line.startswith("#define"):
+                define, value = InstructionBreakdown.define(line)
+
+                if define == "locale":
+                    if not value:
+                        continue
+
+                    locale = value
+
+                elif define == "superiors":
+                    if not value or value[0] in [".", "/", "#"]:
+                        superiors = ""
+
+                    elif isinstance(value, str):
+                        superiors = value
+
+                    elif isinstance(value, list):
+                        superiors = ".".join(value)
+
+                continue
+
+            elif line.startswith("#"):
+                continue
+
+            elif line.startswith(";"):
+                continue
+
+            elif line.startswith("//"):
+                continue
+
+            else:
+                lst = line.split("=", 1)
+                if len(lst) != 2:
+                    continue
+
+                key = lst[0].strip()
+                line = lst[1].strip()
+
+        if line.endswith(" \\"):
+            multiline_mode = True
+            line = line[:-2]
+
+        else:
+            multiline_mode = False
+
+        if len(line) >= 2 and line.startswith('"') and line.endswith('"'):
+            line = line[1:-1]
+
+        if multiline_mode:
+            multiline_line.append(line)
+            continue
+
+        final_key = f"{superiors}.{key}" if superiors != "" else key
+
+        if multiline_line:
+            multiline_line.append(line)
+            line = "\n".join(multiline_line)
+            multiline_line = []
+
+        yield locale, final_key, decode_escape_sequences(line)
+
+    if multiline_line:
+        final_key = f"{superiors}.{key}" if superiors != "" else key
+        line = "\n".join(multiline_line)
+        yield locale, final_key, decode_escape_sequences(line)
+
+
 __all__ = [
     "decode_escape_sequences",
+    "decode_escape_sequences_many",
+    "intern_key",
+    "flatten_dict",
     "get_locale_code",
+    "normalize_language_tag",
+    "parse_accept_language",
     "match_best_locale",
+    "writing_system_chain",
+    "LocaleResolver",
+    "iter_lang_entries",
     "InstructionBreakdown"
 ]
@@ -0,0 +1,536 @@
+# Licensed under the LGPL 3.0 License.
+# i18nco by numlinka.
+# unit test
+
+# std
+import os
+import sys
+import time
+import unittest
+import threading
+import tempfile
+import subprocess
+
+# tests
+import i18nco
+
+
+class TestBaseI18n (unittest.TestCase):
+    def setUp(self) -> None:
+        self.i18n = i18nco.Internationalization()
+        self.i18n.con_load_dict({"hello": "Hello", "mode": {"singleton": "Singleton Mode"}}, "en_US")
+        self.i18n.con_load_dict({"hello": "你好", "world": "世界"}, "zh_CN")
+        self.i18n.con_set_locale("en_US", "zh_CN")
+
+    def test_translation(self) -> None:
+        self.assertEqual(self.i18n.hello, "Hello")
+        self.assertEqual(self.i18n.world, "世界")
+        self.assertEqual(self.i18n.mode.singleton, "Singleton Mode")
+        self.assertEqual(self.i18n.missing, "missing")
+
+    def test_set_locale(self) -> None:
+        self.i18n.con_set_locale("zh_CN")
+        self.assertEqual(self.i18n.con_get_first_locale(), "zh_CN")
+        self.assertEqual(self.i18n.con_get_second_locale(), "en_US")
+        self.assertEqual(self.i18n.hello, "你好")
+
+        self.assertRaises(ValueError, self.i18n.con_set_locale, "en_US", "en_US")
+
+    def test_snapshot_publish(self) -> None:
+        snapshot = self.i18n._sc_snapshot
+
+        with self.i18n._con_transaction():
+            self.i18n.con_add_translation("en_US", "hello", "Hi")
+            self.i18n.con_add_translation(["en_US", "en_GB"], "world", "World")
+            self.assertEqual(self.i18n.hello, "Hello")
+
+        self.assertEqual(self.i18n.hello, "Hi")
+        self.assertEqual(self.i18n.world, "World")
+        self.assertIn("en_GB", self.i18n.con_get_available_locales())
+        self.assertEqual(snapshot.translation["en_US"]["hello"], "Hello")
+        self.assertNotIn("world", snapshot.translation["en_US"])
+
+    def test_transaction_rollback(self) -> None:
+        snapshot = self.i18n._sc_snapshot
+
+        with self.assertRaises(RuntimeError):
+            with self.i18n._con_transaction():
+                self.i18n.con_add_translation("en_US", "hello", "Hi")
+                raise RuntimeError
+
+        self.assertIs(self.i18n._sc_snapshot, snapshot)
+        self.assertEqual(self.i18n.hello, "Hello")
+
+        with tempfile.TemporaryDirectory() as path:
+            os.mkdir(os.path.join(path, "en_US"))
+            with open(os.path.join(path, "en_US", "a.csv"), "w", encoding="utf-8", newline="") as file_object:
+                file_object.write("locale,key,value\nen_US,a,A\n")
+
+            with open(os.path.join(path, "en_US", "b.json"), "w", encoding="utf-8") as file_object:
+                file_object.write('{"b": ')
+
+            i18n = i18nco.Internationalization()
+            self.assertRaises(ValueError, i18n.con_auto_load, path)
+            self.assertEqual(i18n.con_get_available_locales(), [])
+            self.assertEqual(i18n.a, "a")
+
+    def test_single_write_overlay(self) -> None:
+        from i18nco.i18nsnapshot import OVERLAY_LIMIT
+
+        snapshot = self.i18n._sc_snapshot
+        self.i18n.con_add_translation("zh_CN", "hello", "您好")
+        self.i18n.con_add_translation(["en_US", "en_GB"], "added", "Added")
+
+        # Single writes share the tables instead of copying them.
+        self.assertIs(self.i18n._sc_snapshot.translation, snapshot.translation)
+        self.assertIs(self.i18n._sc_snapshot.merged, snapshot.merged)
+        self.assertEqual(self.i18n.hello, "Hello")
+        self.assertEqual(self.i18n.added, "Added")
+        self.assertIn("en_GB", self.i18n.con_get_available_locales())
+        self.assertIn("added", self.i18n.con_keys())
+        self.assertEqual(self.i18n.con_subtree("hello", "zh_CN"), {"hello": "您好"})
+
+        with self.i18n.con_use_locale("zh_CN"):
+            self.assertEqual(self.i18n.hello, "您好")
+            self.i18n.con_add_translation("zh_CN", "world", "世界!")
+            self.assertEqual(self.i18n.world, "世界!")
+
+        for index in range(OVERLAY_LIMIT):
+            self.i18n.con_add_translation("en_US", f"key{index}", str(index))
+
+        self.assertLess(self.i18n._sc_snapshot.overlay_size, OVERLAY_LIMIT)
+        self.assertEqual(self.i18n._sc_snapshot.translation["zh_CN"]["hello"], "您好")
+        self.assertEqual(self.i18n.con_translation(f"key{OVERLAY_LIMIT - 1}"), str(OVERLAY_LIMIT - 1))
+
+        with self.i18n._con_transaction():
+            pass
+
+        self.assertEqual(self.i18n._sc_snapshot.overlay, {})
+        self.assertEqual(self.i18n.added, "Added")
+        self.assertEqual(self.i18n.key0, "0")
+
+    def test_merged_table(self) -> None:
+        merged = self.i18n._sc_snapshot.merged
+        self.assertEqual(merged["hello"], "Hello")
+        self.assertEqual(merged["world"], "世界")
+
+        self.i18n.con_add_translation("zh_CN", "hello", "您好")
+        self.i18n.con_add_translation("zh_CN", "new", "新")
+        self.i18n.con_add_translation("ru_RU", "hello", "Привет")
+        self.assertEqual(self.i18n.hello, "Hello")
+        self.assertEqual(self.i18n.new, "新")
+
+        self.i18n.con_set_locale("zh_CN")
+        self.assertEqual(self.i18n.hello, "您好")
+        self.assertEqual(self.i18n.mode.singleton, "Singleton Mode")
+
+    def test_string_cache(self) -> None:
+        self.assertIs(self.i18n.hello, self.i18n.hello)
+
+        first = self.i18n.hello
+        self.i18n.con_add_translation("en_US", "hello", "Hi")
+        self.assertEqual(self.i18n.hello, "Hi")
+        self.assertIsNot(self.i18n.hello, first)
+
+        self.i18n.con_set_locale("zh_CN")
+        self.assertEqual(self.i18n.hello, "你好")
+
+    def test_accessor(self) -> None:
+        accessor = self.i18n.con_accessor("mode.singleton")
+        self.assertEqual(accessor(), "Singleton Mode")
+        self.assertEqual(accessor.key, "mode.singleton")
+
+        self.i18n.con_add_translation("en_US", "mode.singleton", "Single")
+        self.assertEqual(accessor(), "Single")
+        self.assertEqual(str(accessor), "Single")
+
+        class View (object):
+            title = self.i18n.con_accessor("hello")
+
+        self.assertEqual(View().title, "Hello")
+        self.assertRaises(TypeError, self.i18n.con_accessor, None)
+
+    def test_translate_many(self) -> None:
+        keys = ("hello", "world", "mode.singleton", "missing")
+        self.assertEqual(self.i18n.con_translate_many(keys), ["Hello", "世界", "Singleton Mode", "missing"])
+        self.assertEqual(self.i18n.con_translate_many(["hello"], as_dict=True), {"hello": "Hello"})
+
+    def test_use_locale(self) -> None:
+        with self.i18n.con_use_locale("zh_CN"):
+            self.assertEqual(self.i18n.hello, "你好")
+            self.assertEqual(self.i18n.con_get_locale(), "zh_CN")
+
+            with self.i18n.con_use_locale("ru_RU"):
+                self.assertEqual(self.i18n.hello, "Hello")
+                self.assertEqual(self.i18n.con_get_second_locale(), "en_US")
+
+            self.assertEqual(self.i18n.hello, "你好")
+
+        self.assertEqual(self.i18n.hello, "Hello")
+        self.assertEqual(self.i18n.con_get_locale(), "en_US")
+
+    def test_use_locale_threads(self) -> None:
+        results = {}
+
+        def worker(locale: str) -> None:
+            with self.i18n.con_use_locale(locale):
+                results[locale] = str(self.i18n.hello)
+
+        threads = [threading.Thread(target=worker, args=(x,)) for x in ("en_US", "zh_CN")]
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results, {"en_US": "Hello", "zh_CN": "你好"})
+
+    def test_miss_cache(self) -> None:
+        count = self.i18n.con_get_miss_count()
+        self.assertEqual(self.i18n.missing, "missing")
+        self.assertEqual(self.i18n.missing, "missing")
+        self.assertEqual(self.i18n.con_get_miss_count(), count + 1)
+
+        self.i18n.con_add_translation("zh_CN", "missing", "缺失")
+        self.assertEqual(self.i18n.missing, "缺失")
+
+    def test_add_translations(self) -> None:
+        self.i18n.con_add_translations("en_US", {"hello": "Hi", "bulk": "Bulk"})
+        self.i18n.con_add_translations(["zh_CN", "zh_TW"], {"bulk": "批量"})
+        self.assertEqual(self.i18n.hello, "Hi")
+        self.assertEqual(self.i18n.bulk, "Bulk")
+        self.assertIn("zh_TW", self.i18n.con_get_available_locales())
+
+        self.assertRaises(TypeError, self.i18n.con_add_translations, "en_US", {"a": 1})
+        self.assertRaises(TypeError, self.i18n.con_add_translations, None, {"a": "1"})
+
+    def test_load_csv_i18n(self) -> None:
+        with tempfile.TemporaryDirectory() as path:
+            file_path = os.path.join(path, "text.csv")
+            with open(file_path, "w", encoding="utf-8", newline="") as file_object:
+                file_object.write("lang,id,text\nen_US,hello,Hi\nzh_CN,csv,\"逗号,\\t\"\n")
+
+            self.i18n.con_load_csv_i18n(file_path, locale_column="lang", key_column="id", value_column="text")
+            self.assertRaises(ValueError, self.i18n.con_load_csv_i18n, file_path)
+
+            with open(file_path, "w", encoding="utf-8", newline="") as file_object:
+                file_object.write("locale,key,value\nen_US,a,A\n\nen_US,b\n")
+
+            with self.assertRaisesRegex(ValueError, r"text\.csv, line 4: expected 3 columns, got 2"):
+                self.i18n.con_load_csv_i18n(file_path)
+
+        self.assertEqual(self.i18n.hello, "Hi")
+        self.assertEqual(self.i18n.csv, "逗号,\t")
+        self.assertEqual(self.i18n.a, "a")
+
+    def test_auto_load(self) -> None:
+        with tempfile.TemporaryDirectory() as path:
+            os.mkdir(os.path.join(path, "ru_RU"))
+            with open(os.path.join(path, "ru_RU", "text.lang"), "w", encoding="utf-8") as file_object:
+                file_object.write("hello = Привет\n")
+
+            with open(os.path.join(path, "ja_JP.json"), "w", encoding="utf-8") as file_object:
+                file_object.write('{"hello": "こんにちは", "mode": {"singleton": "シングルトン"}}')
+
+            for workers, use_process in ((1, False), (4, False), (2, True)):
+                i18n = i18nco.Internationalization()
+                i18n.con_auto_load(path, workers=workers, use_process=use_process)
+                i18n.con_set_locale("ru_RU", "ja_JP")
+                self.assertEqual(i18n.text.hello, "Привет")
+                self.assertEqual(i18n.hello, "こんにちは")
+                self.assertEqual(i18n.mode.singleton, "シングルトン")
+
+    def test_catalog(self) -> None:
+        with tempfile.TemporaryDirectory() as path:
+            file_path = os.path.join(path, "text.i18nc")
+            self.i18n.con_add_translation("ru_RU", "empty", "")
+            self.i18n.con_compile_catalog(file_path)
+
+            i18n = i18nco.Internationalization()
+            i18n.con_load_catalog(file_path)
+            i18n.con_set_locale("en_US", "zh_CN")
+            self.assertEqual(sorted(i18n.con_get_available_locales()), ["en_US", "ru_RU", "zh_CN"])
+            self.assertEqual(i18n.hello, "Hello")
+            self.assertEqual(i18n.world, "世界")
+            self.assertEqual(i18n.mode.singleton, "Singleton Mode")
+            self.assertEqual(i18n.missing, "missing")
+
+            # Lookups search the mapped file, the texts are not copied into the merged table.
+            self.assertNotIsInstance(i18n._sc_snapshot.merged, dict)
+            self.assertIsNone(i18n._sc_snapshot.translation["en_US"]._index)
+
+            i18n.con_add_translation("en_US", "hello", "Hi")
+            self.assertEqual(i18n.hello, "Hi")
+            i18n.con_load_catalog(file_path)
+            self.assertEqual(i18n.hello, "Hello")
+
+            i18n.con_set_locale("ru_RU")
+            self.assertEqual(i18n.empty, "")
+
+            # Recompiling replaces the file instead of truncating it under the mapped catalog.
+            mapped = i18nco.Internationalization()
+            mapped.con_load_catalog(file_path)
+            inode = os.stat(file_path).st_ino
+
+            small = i18nco.Internationalization()
+            small.con_add_translation("ru_RU", "empty", "-")
+            small.con_compile_catalog(file_path)
+            self.assertNotEqual(os.stat(file_path).st_ino, inode)
+            self.assertEqual(os.listdir(path), ["text.i18nc"])
+
+            mapped.con_set_locale("ru_RU")
+            self.assertEqual(mapped.empty, "")
+            self.assertEqual(mapped.con_subtree("mode", "en_US"), {"mode.singleton": "Singleton Mode"})
+            del mapped
+
+            with open(file_path, "wb") as file_object:
+                file_object.write(b"not a catalog")
+
+            self.assertRaises(ValueError, i18n.con_load_catalog, file_path)
+            del i18n
+
+    def test_auto_load_lazy(self) -> None:
+        with tempfile.TemporaryDirectory() as path:
+            for locale, text in (("en_US", "Hello"), ("ru_RU", "Привет"), ("ja_JP", "こんにちは")):
+                with open(os.path.join(path, f"{locale}.lang"), "w", encoding="utf-8") as file_object:
+                    file_object.write(f"hello = {text}\n")
+
+            i18n = i18nco.Internationalization()
+            i18n.con_set_locale("en_US", "ja_JP")
+            i18n.con_auto_load(path, lazy=True)
+
+            translation = i18n._sc_snapshot.translation
+            self.assertEqual(sorted(i18n.con_get_available_locales()), ["en_US", "ja_JP", "ru_RU"])
+            self.assertIsInstance(translation["en_US"], dict)
+            self.assertFalse(translation["ru_RU"].loaded)
+            self.assertEqual(i18n.hello, "Hello")
+
+            self.assertEqual(i18n.con_keys(), ["hello"])
+            self.assertFalse(translation["ru_RU"].loaded)
+            self.assertEqual(i18n.con_subtree("hello", "ja_JP"), {"hello": "こんにちは"})
+            self.assertFalse(translation["ru_RU"].loaded)
+
+            i18n.con_set_locale("ru_RU")
+            self.assertEqual(i18n.hello, "Привет")
+            self.assertTrue(translation["ru_RU"].loaded)
+            self.assertEqual(i18n.con_subtree("hello"), {"hello": "Привет"})
+
+    def test_auto_load_lazy_define(self) -> None:
+        with tempfile.TemporaryDirectory() as path:
+            with open(os.path.join(path, "ja_JP.lang"), "w", encoding="utf-8") as file_object:
+                file_object.write("hello = こんにちは\n#define locale zh_CN\n#define superiors app\nshared = 共享\n")
+
+            eager = i18nco.Internationalization()
+            eager.con_auto_load(path)
+
+            lazy = i18nco.Internationalization()
+            report = lazy.con_auto_load(path, lazy=True)
+
+            self.assertEqual(report.deferred, [])
+            self.assertEqual(lazy.con_subtree(locale="zh_CN"), eager.con_subtree(locale="zh_CN"))
+            self.assertEqual(lazy.con_subtree(locale="zh_CN"), {"app.shared": "共享"})
+
+    def test_auto_load_lazy_error(self) -> None:
+        with tempfile.TemporaryDirectory() as path:
+            with open(os.path.join(path, "ru_RU.json"), "w", encoding="utf-8") as file_object:
+                file_object.write('{"hello": ')
+
+            with open(os.path.join(path, "ru_RU.lang"), "w", encoding="utf-8") as file_object:
+                file_object.write("world = Мир\n")
+
+            self.i18n.con_auto_load(path, lazy=True)
+            table = self.i18n._sc_snapshot.translation["ru_RU"]
+
+            with self.i18n.con_use_locale("ru_RU"):
+                with self.assertLogs("i18nco.components", "ERROR"):
+                    self.assertEqual(self.i18n.hello, "你好")
+
+                self.assertEqual(self.i18n.world, "Мир")
+
+            self.assertTrue(table.loaded)
+            self.assertEqual([file_path for file_path, _ in table.errors], [os.path.join(path, "ru_RU.json")])
+
+    def test_watch(self) -> None:
+        with tempfile.TemporaryDirectory() as path:
+            file_path = os.path.join(path, "en_US.lang")
+            with open(file_path, "w", encoding="utf-8") as file_object:
+                file_object.write("hello = Hello\nworld = World\n")
+
+            i18n = i18nco.Internationalization()
+            watcher = i18n.con_watch(path, start=False)
+            self.assertEqual(i18n.hello, "Hello")
+            self.assertEqual(watcher.poll(), 0)
+
+            with open(file_path, "w", encoding="utf-8") as file_object:
+                file_object.write("hello = Hi\nnew = New\n")
+
+            os.utime(file_path, ns=(0, 0))
+            self.assertEqual(watcher.poll(), 1)
+            self.assertEqual(i18n.hello, "Hi")
+            self.assertEqual(i18n.new, "New")
+            self.assertEqual(i18n.world, "world")
+
+            os.remove(file_path)
+            self.assertEqual(watcher.poll(), 1)
+            self.assertEqual(i18n.hello, "hello")
+
+    def test_watch_load_order(self) -> None:
+        with tempfile.TemporaryDirectory() as path:
+            os.mkdir(os.path.join(path, "en_US"))
+            for name, text in (("a", "A"), ("b", "B")):
+                with open(os.path.join(path, "en_US", f"{name}.json"), "w", encoding="utf-8") as file_object:
+                    file_object.write(f'{{"k": "{text}"}}')
+
+            i18n = i18nco.Internationalization()
+            watcher = i18n.con_watch(path, start=False)
+
+            for name in ("a", "b"):
+                file_path = os.path.join(path, "en_US", f"{name}.json")
+                with open(file_path, "w", encoding="utf-8") as file_object:
+                    file_object.write(f'{{"k": "{name.upper()}2"}}')
+
+                os.utime(file_path, ns=(0, 0))
+                self.assertEqual(watcher.poll(), 1)
+
+                reload = i18nco.Internationalization()
+                reload.con_auto_load(path)
+                self.assertEqual(i18n.k, reload.k)
+
+            # A key removed from the winning file falls back to the other file.
+            for name in ("a", "b"):
+                file_path = os.path.join(path, "en_US", f"{name}.json")
+                with open(file_path, "w", encoding="utf-8") as file_object:
+                    file_object.write("{}")
+
+                os.utime(file_path, ns=(1, 1))
+                self.assertEqual(watcher.poll(), 1)
+
+                reload = i18nco.Internationalization()
+                reload.con_auto_load(path)
+                self.assertEqual(i18n.k, reload.k)
+
+            self.assertEqual(i18n.k, "k")
+
+    def test_watch_errors(self) -> None:
+        with tempfile.TemporaryDirectory() as path:
+            watch_path = os.path.join(path, "i18n")
+            os.mkdir(watch_path)
+
+            i18n = i18nco.Internationalization()
+            watcher = i18n.con_watch(watch_path, interval=0.01)
+
+            with self.assertLogs("i18nco.components", "ERROR"):
+                os.rmdir(watch_path)
+                time.sleep(0.1)
+
+            self.assertTrue(watcher._thread.is_alive())
+            watcher.stop()
+
+    def test_key_interning(self) -> None:
+        self.i18n.con_add_translations("ru_RU", {"".join(["he", "llo"]): "Привет"})
+        keys = {id(key) for table in self.i18n._sc_snapshot.translation.values() for key in table if key == "hello"}
+        self.assertEqual(len(keys), 1)
+
+    def test_namespace(self) -> None:
+        self.i18n.con_add_translations("en_US", {"mode-x": "x", "mode.multiple": "Multiple", "modes": "Modes"})
+        self.assertEqual(self.i18n.con_keys("mode"), ["mode.multiple", "mode.singleton"])
+        self.assertEqual(self.i18n.con_keys("nothing"), [])
+        self.assertEqual(len(self.i18n.con_keys()), 6)
+
+        self.assertEqual(self.i18n.con_subtree("mode"), {"mode.multiple": "Multiple", "mode.singleton": "Singleton Mode"})
+        self.assertEqual(self.i18n.con_subtree("mode", "zh_CN"), {})
+        self.assertEqual(self.i18n.con_subtree("world", "zh_CN"), {"world": "世界"})
+
+        # Writes carry the sorted key index over to the new snapshot instead of rebuilding it.
+        self.i18n.con_add_translation("zh_CN", "mode.single", "单")
+        self.assertIsNotNone(self.i18n._sc_snapshot.index)
+        self.assertEqual(self.i18n.con_keys("mode"), ["mode.multiple", "mode.single", "mode.singleton"])
+
+        self.i18n.con_add_translations("en_US", {"mode.auto": "Auto"})
+        self.assertIsNotNone(self.i18n._sc_snapshot.index)
+        self.assertEqual(self.i18n.con_keys("mode")[0], "mode.auto")
+
+    def test_match_locale(self) -> None:
+        self.assertEqual(self.i18n.con_match_locale("en_GB"), "en_US")
+        self.assertEqual(self.i18n.con_match_locale("zh_TW"), "zh_CN")
+
+        self.i18n.con_add_translation("zh_TW", "hello", "你好")
+        self.assertEqual(self.i18n.con_match_locale("zh_TW"), "zh_TW")
+
+    def test_deferred_imports(self) -> None:
+        code = "import sys, i18nco; i18nco.Internationalization().hello; " \
+               "print(sorted(name for name in ('i18nco.constants', 'i18nco.i18ncatalog', 'json', 'csv') " \
+               "if name in sys.modules))"
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True,
+                                env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)})
+        self.assertEqual(result.stdout.strip(), "[]")
+
+    def test_negotiate_locales(self) -> None:
+        self.assertEqual(self.i18n.con_negotiate_locales("zh-CN,en;q=0.8"), ["zh_CN", "en_US"])
+        self.assertEqual(self.i18n.con_negotiate_locales("ja"), [])
+
+    def test_fallback_chain(self) -> None:
+        self.i18n.con_add_translations("zh_TW", {"tw": "台灣"})
+        self.i18n.con_add_translations("zh_HK", {"hello": "哈囉"})
+
+        chain = self.i18n.con_get_writing_system_chain("zh_HK", "en_US")
+        self.assertEqual(chain, ["zh_HK", "zh_CN", "zh_TW", "en_US"])
+
+        self.i18n.con_set_fallback_chain(["zh_HK", "zh_TW", "zh_CN", "en_US"])
+        self.assertEqual(self.i18n.hello, "哈囉")
+        self.assertEqual(self.i18n.tw, "台灣")
+        self.assertEqual(self.i18n.world, "世界")
+        self.assertEqual(self.i18n.mode.singleton, "Singleton Mode")
+
+        self.i18n.con_set_locale("zh_TW")
+        self.assertEqual(self.i18n.con_get_fallback_chain(), ["zh_TW", "zh_HK", "zh_CN", "en_US"])
+
+        with self.i18n.con_use_fallback_chain(["en_US"]):
+            self.assertEqual(self.i18n.world, "world")
+
+        self.assertRaises(ValueError, self.i18n.con_set_fallback_chain, [])
+        self.assertRaises(ValueError, self.i18n.con_set_fallback_chain, ["en_US", "en_US"])
+
+    def test_load_report(self) -> None:
+        with tempfile.TemporaryDirectory() as path:
+            with open(os.path.join(path, "en_US.lang"), "w", encoding="utf-8") as file_object:
+                file_object.write("hello = Hi\nnew = New\n")
+
+            with open(os.path.join(path, "ru_RU.json"), "w", encoding="utf-8") as file_object:
+                file_object.write('{"hello": "Привет"}')
+
+            report = self.i18n.con_auto_load(path)
+            self.assertEqual(len(report.files), 2)
+            self.assertEqual(report.entries, 3)
+            self.assertEqual(report.overwritten, 1)
+            self.assertEqual(report.locales, {"en_US", "ru_RU"})
+            self.assertEqual(report.by_format()["lang"]["entries"], 2)
+            self.assertEqual(report.as_dict()["files"][0]["bytes"] + report.as_dict()["files"][1]["bytes"], report.bytes)
+
+            report = self.i18n.con_load_lang(os.path.join(path, "en_US.lang"), "en_US")
+            self.assertEqual((report.entries, report.overwritten), (2, 2))
+
+            # The files of the fallback chain are parsed right away, so they are not deferred.
+            report = i18nco.Internationalization().con_auto_load(path, lazy=True)
+            self.assertEqual(report.deferred, [os.path.join(path, "ru_RU.json")])
+            self.assertEqual([file.file_path for file in report.files], [os.path.join(path, "en_US.lang")])
+
+    def test_metrics(self) -> None:
+        self.assertEqual(self.i18n.con_get_metrics(), {})
+        self.i18n.con_enable_metrics(sample_every=1)
+
+        for key in ("hello", "hello", "world", "missing", "missing", "con_get_locale"):
+            self.i18n.con_translation(key)
+
+        self.i18n.con_translate_many(["mode.singleton"])
+
+        metrics = self.i18n.con_get_metrics()
+        self.assertEqual(metrics["lookups"], 7)
+        self.assertEqual(metrics["hits"], {"en_US": 3, "zh_CN": 1})
+        self.assertEqual(metrics["fallbacks"], 1)
+        self.assertEqual(metrics["misses"], 3)
+        self.assertEqual(metrics["missing_keys"][0], ("missing", 2))
+        self.assertEqual(sum(metrics["latency_ns"].values()), 7)
+
+        self.i18n.con_disable_metrics()
+        self.assertEqual(self.i18n.con_get_metrics(), {})
@@ -0,0 +1,33 @@
+# Licensed under the LGPL 3.0 License.
+# i18nco by numlinka.
+# unit test
+
+# std
+import unittest
+
+# tests
+import i18nco.i18nstring
+
+
+class TestI18nString (unittest.TestCase):
+    def test_sformat(self) -> None:
+        alt = i18nco.i18nstring.I18nString
+        self.assertEqual(alt("").sformat(), "")
+        self.assertEqual(alt("hello").sformat(1, a=2), "hello")
+        self.assertEqual(alt("{0} + {1}").sformat(1, 2), "1 + 2")
+        self.assertEqual(alt("{name}: {0}").sformat(3, name="x"), "x: 3")
+        self.assertEqual(alt("{0} {missing}").sformat("a"), "a {missing}")
+        self.assertEqual(alt("{{0}}").sformat("a"), "{a}")
+
+        # Partial formatting, a few values for many placeholders.
+        template = alt("{a} {b} {c} {d} {e} {f} {0}")
+        self.assertEqual(template.sformat("x"), "{a} {b} {c} {d} {e} {f} x")
+        self.assertEqual(template.sformat(a=1), "1 {b} {c} {d} {e} {f} {0}")
+        self.assertEqual(template.sformat("{a}"), "{a} {b} {c} {d} {e} {f} {a}")
+        self.assertEqual(template.sformat(b="{0}", a="{b}"), "{b} {0} {c} {d} {e} {f} {0}")
+        self.assertIs(template.sformat(), template)
+
+    def test_compile_template(self) -> None:
+        alt = i18nco.i18nstring.compile_template
+        self.assertEqual(alt("a{0}b{x}"), (("a", "b", ""), ("0", "x")))
+        self.assertEqual(alt("text"), (("text",), ()))
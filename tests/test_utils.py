@@ -6,6 +6,7 @@
 import unittest
 
 # tests
+import i18nco
 import i18nco.utils
 
 
@@ -35,3 +36,70 @@ class TestUtils (unittest.TestCase):
         self.assertEqual(alt("#define a b"), ("a", ["b"]))
         self.assertEqual(alt("#define a b c"), ("a", ["b", "c"]))
         self.assertEqual(alt("#define a b c d"), ("a", ["b", "c", "d"]))
+
+    def test_flatten_dict(self) -> None:
+        alt = i18nco.utils.flatten_dict
+        self.assertEqual(alt({}), {})
+        self.assertEqual(alt({"a": "1", "b": {"c": "2", "d": {"e": "3"}}}), {"a": "1", "b.c": "2", "b.d.e": "3"})
+        self.assertEqual(alt({"a": "1", "b": 2}, "x"), {"x.a": "1"})
+
+    def test_iter_lang_entries(self) -> None:
+        alt = i18nco.utils.iter_lang_entries
+        lines = [
+            "; comment",
+            "hello = Hello",
+            "separation = \" | \"",
+            "robert = I have become death \\",
+            "         the destroyer of worlds",
+            "#define superiors mode",
+            "singleton = Singleton\\tMode",
+            "#define locale zh_CN en_GB",
+            "#define superiors",
+            "hello = 你好",
+        ]
+        self.assertEqual(list(alt(lines, "en_US")), [
+            ("en_US", "hello", "Hello"),
+            ("en_US", "separation", " | "),
+            ("en_US", "robert", "I have become death\nthe destroyer of worlds"),
+            ("en_US", "mode.singleton", "Singleton\tMode"),
+            (["zh_CN", "en_GB"], "hello", "你好"),
+        ])
+        self.assertEqual(list(alt(["a = b \\"], "en_US", "x")), [("en_US", "x.a", "b")])
+
+    def test_intern_key(self) -> None:
+        alt = i18nco.utils.intern_key
+        key = "".join(["settings.", "network"])
+        self.assertIs(alt(key), alt("settings.network"))
+        self.assertIs(type(alt(i18nco.I18nString("a.b"))), str)
+
+    def test_LocaleResolver(self) -> None:
+        available = ["en_GB", "zh_TW", "ru_RU"]
+        alt = i18nco.utils.LocaleResolver(available)
+        for target in ("", "en_US", "en_GB", "zh_CN", "zh_TW", "ja_JP", "uk_UA", "xx_XX"):
+            self.assertEqual(alt.resolve(target), i18nco.utils.match_best_locale(target, available))
+
+        self.assertIsNone(i18nco.utils.LocaleResolver([]).resolve("en_US"))
+
+    def test_parse_accept_language(self) -> None:
+        alt = i18nco.utils.parse_accept_language
+        self.assertEqual(alt(""), [])
+        self.assertEqual(alt("de-CH,de;q=0.9,en;q=0.7"), ["de_CH", "de", "en"])
+        self.assertEqual(alt("en;q=0.5, zh-hant-tw, *;q=0.1, fr;q=0"), ["zh_Hant_TW", "en"])
+        self.assertEqual(alt("ja;q=x,ko;q=0.8,ru;q=0.8"), ["ko", "ru"])
+
+    def test_LocaleResolver_negotiate(self) -> None:
+        alt = i18nco.utils.LocaleResolver(["en_US", "de_DE", "zh_CN"])
+        self.assertEqual(alt.negotiate("de-CH,de;q=0.9,en;q=0.7"), ["de_DE", "en_US"])
+        self.assertEqual(alt.negotiate("zh-TW,fr-FR;q=0.5"), ["zh_CN", "en_US"])
+
+    def test_writing_system_chain(self) -> None:
+        alt = i18nco.utils.writing_system_chain
+        self.assertEqual(alt("zh_HK", ["zh_CN", "zh_TW", "en_US"]), ["zh_CN", "zh_TW"])
+        self.assertEqual(alt("zh_HK", ["zh_HK", "zh_TW"]), ["zh_HK", "zh_TW"])
+        self.assertEqual(alt("xx_XX"), ["xx_XX"])
+        self.assertEqual(alt("ja_JP")[0], "ja_JP")
+
+    def test_decode_escape_sequences_many(self) -> None:
+        alt = i18nco.utils.decode_escape_sequences_many
+        self.assertEqual(alt([]), [])
+        self.assertEqual(alt(["plain", "a\\tb", "\\x41\\q", "\\u"]), ["plain", "a\tb", "Aq", "u"])